@@ -2,6 +2,8 @@
 Bugout Python API
 """
 
+from typing import Any
+
 __author__ = "Bugout"
 __maintainer__ = __author__
 __description__ = "Python client library for Bugout API"
@@ -16,4 +18,24 @@ __all__ = (
     "__license__",
     "__maintainer__",
     "__version__",
+    "Bugout",
+    "Method",
 )
+
+# Submodules are imported on first attribute access, so "import bugout" stays cheap
+_LAZY_ATTRIBUTES = {
+    "Bugout": "app",
+    "Method": "enums",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,43 +1,84 @@
-import argparse
-import textwrap
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, List
 
-from .app import Bugout
-from .jobs import generate_cli as generate_jobs_cli
+from . import __version__
 
+if TYPE_CHECKING:
+    import argparse
 
-def get_methods_list(args: argparse.Namespace) -> None:
+BUGOUT_DESCRIPTION = "Bugout API: Tools for helping with Bugout API."
+BUGOUT_USAGE = "usage: bugout [-h] [-V] {methods,jobs} ..."
+
+
+def get_methods_list(args: "argparse.Namespace") -> None:
     """
     Return list of all API methods.
     """
-    methods = [method for method in Bugout.__dict__.keys()]
-    print(methods[2:-3])
+    from .app import Bugout
 
+    print(sorted(Bugout.PUBLIC_METHODS))
 
-def main() -> None:
-    bugout_description = textwrap.dedent(
-        """\
-        Bugout API: Tools for helping with Bugout API.
-        """
-    )
-    parser = argparse.ArgumentParser(prog="bugout", description=bugout_description)
-    parser.set_defaults(func=lambda _: parser.print_help())
-    subcommands = parser.add_subparsers(description="Bugout API commands")
 
-    parser_common = subcommands.add_parser(
-        "methods", description="Work with Bugout users API handlers"
-    )
-    parser_common.set_defaults(func=get_methods_list)
+def print_help() -> None:
+    print(BUGOUT_USAGE)
+    print()
+    print(BUGOUT_DESCRIPTION)
+    print()
+    print("options:")
+    print("  -h, --help     show this help message and exit")
+    print("  -V, --version  show version and exit")
+    print()
+    print("Bugout API commands:")
+    print("  methods        Work with Bugout users API handlers")
+    print("  jobs           Manage jobs using a Bugout journal")
 
-    parser_jobs = generate_jobs_cli()
-    subcommands.add_parser(
-        "jobs",
-        parents=[parser_jobs],
-        add_help=False,
+
+def _run_methods(argv: List[str]) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="bugout methods", description="Work with Bugout users API handlers"
     )
+    parser.set_defaults(func=get_methods_list)
+    args = parser.parse_args(argv)
+    args.func(args)
+
 
-    args = parser.parse_args()
+def _run_jobs(argv: List[str]) -> None:
+    from .jobs import get_cli as get_jobs_cli
+
+    parser = get_jobs_cli(prog="bugout jobs")
+    args = parser.parse_args(argv)
     args.func(args)
 
 
+COMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    "methods": _run_methods,
+    "jobs": _run_jobs,
+}
+
+
+def main() -> None:
+    # Argparse tree is built only for the subcommand that was actually requested
+    argv = sys.argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        print_help()
+        return
+    if len(argv) == 1 and argv[0] in ("-V", "--version"):
+        print(__version__)
+        return
+
+    command = COMMANDS.get(argv[0])
+    if command is None:
+        print(BUGOUT_USAGE, file=sys.stderr)
+        print(
+            f"bugout: error: invalid choice: '{argv[0]}' (choose from 'methods', 'jobs')",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+
+    command(argv[1:])
+
+
 if __name__ == "__main__":
     main()
@@ -1,30 +1,232 @@
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from pydantic import parse_obj_as
 
 from . import data
-from .calls import ping
+from .cache import TTLCache, cached_get, invalidates_cache
+from .calls import (
+    HttpxBackend,
+    SessionType,
+    TimeoutType,
+    build_session,
+    make_request,
+    shared_session,
+)
+from .exceptions import InvalidBackendSpec
 from .group import Group
 from .humbug import Humbug
 from .journal import Journal, SearchOrder, TagsAction
 from .resource import Resource
-from .settings import BUGOUT_BROOD_URL, BUGOUT_SPIRE_URL, REQUESTS_TIMEOUT
+from .settings import (
+    BUGOUT_BROOD_URL,
+    BUGOUT_POOL_MAXSIZE,
+    BUGOUT_SPIRE_URL,
+    REQUESTS_TIMEOUT,
+)
 from .user import User
 
 
+# Enum conversions of API arguments, the same few strings are passed on every call
+@lru_cache(maxsize=None)
+def _auth(auth_type: str) -> data.AuthType:
+    return data.AuthType[auth_type]
+
+
+@lru_cache(maxsize=None)
+def _token_type(
+    token_type: Optional[Union[str, data.TokenType]]
+) -> Optional[data.TokenType]:
+    return data.TokenType(token_type) if token_type is not None else None
+
+
+@lru_cache(maxsize=None)
+def _role(user_type: Union[str, data.Role]) -> data.Role:
+    return data.Role(user_type)
+
+
+@lru_cache(maxsize=None)
+def _holder(holder_type: Union[str, data.HolderType]) -> data.HolderType:
+    return data.HolderType(holder_type)
+
+
+@lru_cache(maxsize=1024)
+def _id(value: Any) -> Any:
+    """
+    Same ids are usually passed in loops, format UUID into string once.
+    """
+    return str(value) if isinstance(value, uuid.UUID) else value
+
+
+@lru_cache(maxsize=None)
+def _journal_type(
+    journal_type: Optional[Union[str, data.JournalTypes]]
+) -> data.JournalTypes:
+    return data.JournalTypes(journal_type)
+
+
+@lru_cache(maxsize=None)
+def _representation(
+    representation: Union[str, data.EntryRepresentationTypes]
+) -> data.EntryRepresentationTypes:
+    return data.EntryRepresentationTypes(representation)
+
+
+def _entries_batches(
+    entries: List[Dict[str, Any]], batch_size: int
+) -> List[data.BugoutJournalEntriesRequest]:
+    """
+    Validate entries with single parse_obj_as call and split them into bulk requests.
+    """
+    entries_items = parse_obj_as(List[data.BugoutJournalEntryRequest], entries)
+    return [
+        data.BugoutJournalEntriesRequest(entries=entries_items[i : i + batch_size])
+        for i in range(0, len(entries_items), batch_size)
+    ]
+
+
+def _freeze_public_api(cls: Type["Bugout"]) -> Type["Bugout"]:
+    """
+    Collect public API method names once at class creation.
+    """
+    cls.PUBLIC_METHODS = frozenset(
+        name
+        for name, value in vars(cls).items()
+        if callable(value) and not name.startswith("_")
+    )
+    return cls
+
+
+@_freeze_public_api
 class Bugout:
+    PUBLIC_METHODS: ClassVar[FrozenSet[str]]
+
+    __slots__ = (
+        "brood_api_url",
+        "spire_api_url",
+        "_brood_ping_url",
+        "_spire_ping_url",
+        "_session",
+        "_owns_session",
+        "_cache",
+        "_user",
+        "_group",
+        "_humbug",
+        "_journal",
+        "_resource",
+    )
+
     def __init__(
         self,
         brood_api_url: str = BUGOUT_BROOD_URL,
         spire_api_url: str = BUGOUT_SPIRE_URL,
+        backend: str = "requests",
+        session: Optional[SessionType] = None,
+        pool_maxsize: Optional[int] = None,
     ) -> None:
+        """
+        backend: "requests" (default) or "httpx" to multiplex calls over HTTP/2,
+        the latter requires optional dependency: pip install "bugout[httpx]"
+        session: preconfigured session to use instead of creating one for backend
+        pool_maxsize: connections kept alive per host, if it is not set "requests"
+        clients share module level session from bugout.calls.shared_session
+        """
         self.brood_api_url = brood_api_url
         self.spire_api_url = spire_api_url
+        self._brood_ping_url = f"{brood_api_url.rstrip('/')}/ping"
+        self._spire_ping_url = f"{spire_api_url.rstrip('/')}/ping"
+
+        # One session for all sub-clients, so brood and spire connections are kept alive
+        # Passed and shared sessions are closed by their owners
+        self._session: SessionType
+        self._owns_session = session is None
+        if session is not None:
+            self._session = session
+        elif backend == "requests":
+            if pool_maxsize is None:
+                self._session = shared_session()
+                self._owns_session = False
+            else:
+                self._session = build_session(pool_maxsize=pool_maxsize)
+        elif backend == "httpx":
+            self._session = HttpxBackend(
+                max_keepalive_connections=(
+                    pool_maxsize if pool_maxsize is not None else BUGOUT_POOL_MAXSIZE
+                )
+            )
+        else:
+            raise InvalidBackendSpec(f"Unsupported HTTP backend: {backend}")
+
+        self._cache = TTLCache()
+
+        # Sub-clients are created on first access
+        self._user: Optional[User] = None
+        self._group: Optional[Group] = None
+        self._humbug: Optional[Humbug] = None
+        self._journal: Optional[Journal] = None
+        self._resource: Optional[Resource] = None
+
+    @property
+    def user(self) -> User:
+        if self._user is None:
+            self._user = User(self.brood_api_url, session=self._session)
+        return self._user
 
-        self.user = User(self.brood_api_url)
-        self.group = Group(self.brood_api_url)
-        self.humbug = Humbug(self.spire_api_url)
-        self.journal = Journal(self.spire_api_url)
-        self.resource = Resource(self.brood_api_url)
+    @property
+    def group(self) -> Group:
+        if self._group is None:
+            self._group = Group(self.brood_api_url, session=self._session)
+        return self._group
+
+    @property
+    def humbug(self) -> Humbug:
+        if self._humbug is None:
+            self._humbug = Humbug(self.spire_api_url, session=self._session)
+        return self._humbug
+
+    @property
+    def journal(self) -> Journal:
+        if self._journal is None:
+            self._journal = Journal(self.spire_api_url, session=self._session)
+        return self._journal
+
+    @property
+    def resource(self) -> Resource:
+        if self._resource is None:
+            self._resource = Resource(self.brood_api_url, session=self._session)
+        return self._resource
+
+    @property
+    def session(self) -> SessionType:
+        return self._session
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached results of read calls, e.g. after permissions were changed.
+        """
+        self._cache.clear()
+
+    def close(self) -> None:
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "Bugout":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
     @property
     def brood_url(self):
@@ -34,11 +236,17 @@ class Bugout:
     def spire_url(self):
         return self.spire_api_url
 
+    @cached_get()
     def brood_ping(self) -> Dict[str, str]:
-        return ping(self.brood_api_url)
+        return make_request(
+            data.Method.get, self._brood_ping_url, session=self._session
+        )
 
+    @cached_get()
     def spire_ping(self) -> Dict[str, str]:
-        return ping(self.spire_api_url)
+        return make_request(
+            data.Method.get, self._spire_ping_url, session=self._session
+        )
 
     # User handlers
     def create_user(
@@ -48,44 +256,44 @@ class Bugout:
         password: Optional[str] = None,
         signature: Optional[str] = None,
         application_id: Optional[Union[str, uuid.UUID]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.create_user(
             username=username,
             email=email,
             password=password,
             signature=signature,
             application_id=application_id,
+            timeout=timeout,
             **kwargs,
         )
 
     def get_user(
         self,
         token: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.get_user(
-            token=token,
-            auth_type=data.AuthType[auth_type],
-            **kwargs,
+            token=token, auth_type=_auth(auth_type), timeout=timeout, **kwargs
         )
 
     def get_user_by_id(
         self,
         token: Union[str, uuid.UUID],
         user_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.get_user_by_id(
-            token=token, user_id=user_id, auth_type=data.AuthType[auth_type], **kwargs
+            token=token,
+            user_id=_id(user_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
         )
 
     def find_user(
@@ -95,16 +303,16 @@ class Bugout:
         username: Optional[str] = None,
         application_id: Optional[Union[str, uuid.UUID]] = None,
         token: Optional[Union[str, uuid.UUID]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.find_user(
-            user_id=user_id,
+            user_id=_id(user_id),
             email=email,
             username=username,
             application_id=application_id,
             token=token,
+            timeout=timeout,
             **kwargs,
         )
 
@@ -112,39 +320,44 @@ class Bugout:
         self,
         token: Union[str, uuid.UUID],
         verification_code: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.confirm_email(token=token, verification_code=verification_code)
+        return self.user.confirm_email(
+            token=token, verification_code=verification_code, timeout=timeout
+        )
 
     def restore_password(
         self,
         email: str,
         application_id: Optional[Union[str, uuid.UUID]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> Dict[str, str]:
-        self.user.timeout = timeout
-        return self.user.restore_password(email=email, application_id=application_id)
+        return self.user.restore_password(
+            email=email, application_id=application_id, timeout=timeout
+        )
 
     def reset_password(
         self,
         reset_id: Union[str, uuid.UUID],
         new_password: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
-        return self.user.reset_password(reset_id=reset_id, new_password=new_password)
+        return self.user.reset_password(
+            reset_id=reset_id, new_password=new_password, timeout=timeout
+        )
 
     def change_password(
         self,
         token: Union[str, uuid.UUID],
         current_password: str,
         new_password: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.change_password(
-            token=token, current_password=current_password, new_password=new_password
+            token=token,
+            current_password=current_password,
+            new_password=new_password,
+            timeout=timeout,
         )
 
     def delete_user(
@@ -152,12 +365,15 @@ class Bugout:
         token: Union[str, uuid.UUID],
         user_id: Union[str, uuid.UUID],
         password: Optional[str] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutUser:
-        self.user.timeout = timeout
         return self.user.delete_user(
-            token=token, user_id=user_id, password=password, **kwargs
+            token=token,
+            user_id=_id(user_id),
+            password=password,
+            timeout=timeout,
+            **kwargs,
         )
 
     # Token handlers
@@ -167,58 +383,57 @@ class Bugout:
         password: str,
         application_id: Optional[Union[str, uuid.UUID]] = None,
         token_note: Optional[str] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutToken:
-        self.user.timeout = timeout
         return self.user.create_token(
             username=username,
             password=password,
             application_id=application_id,
             token_note=token_note,
+            timeout=timeout,
         )
 
     def create_token_restricted(
         self,
         token: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutToken:
-        self.user.timeout = timeout
-        return self.user.create_token_restricted(token=token)
+        return self.user.create_token_restricted(token=token, timeout=timeout)
 
     def revoke_token(
         self,
         token: Union[str, uuid.UUID],
         target_token: Optional[Union[str, uuid.UUID]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> uuid.UUID:
-        self.user.timeout = timeout
-        return self.user.revoke_token(token=token, target_token=target_token)
+        return self.user.revoke_token(
+            token=token, target_token=target_token, timeout=timeout
+        )
 
     def revoke_token_by_id(
-        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+        self, token: Union[str, uuid.UUID], timeout: TimeoutType = REQUESTS_TIMEOUT
     ) -> uuid.UUID:
-        self.user.timeout = timeout
-        return self.user.revoke_token_by_id(token=token)
+        return self.user.revoke_token_by_id(token=token, timeout=timeout)
 
     def update_token(
         self,
         token: Union[str, uuid.UUID],
         token_type: Optional[Union[str, data.TokenType]] = None,
         token_note: Optional[str] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutToken:
-        self.user.timeout = timeout
         return self.user.update_token(
             token=token,
-            token_type=data.TokenType(token_type) if token_type is not None else None,
+            token_type=_token_type(token_type),
             token_note=token_note,
+            timeout=timeout,
         )
 
+    @cached_get()
     def get_token_types(
-        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+        self, token: Union[str, uuid.UUID], timeout: TimeoutType = REQUESTS_TIMEOUT
     ) -> List[str]:
-        self.user.timeout = timeout
-        return self.user.get_token_types(token=token)
+        return self.user.get_token_types(token=token, timeout=timeout)
 
     def get_user_tokens(
         self,
@@ -226,14 +441,14 @@ class Bugout:
         active: Optional[bool] = None,
         token_type: Optional[Union[str, data.TokenType]] = None,
         restricted: Optional[bool] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutUserTokens:
-        self.user.timeout = timeout
         return self.user.get_user_tokens(
             token=token,
             active=active,
-            token_type=data.TokenType(token_type) if token_type is not None else None,
+            token_type=_token_type(token_type),
             restricted=restricted,
+            timeout=timeout,
         )
 
     # Group handlers
@@ -241,34 +456,36 @@ class Bugout:
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
-        return self.group.get_group(token=token, group_id=group_id)
+        return self.group.get_group(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
 
     def find_group(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.user.timeout = timeout
-        return self.group.find_group(token=token, group_id=group_id)
+        return self.group.find_group(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
 
     def get_user_groups(
-        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+        self, token: Union[str, uuid.UUID], timeout: TimeoutType = REQUESTS_TIMEOUT
     ) -> data.BugoutUserGroups:
-        self.group.timeout = timeout
-        return self.group.get_user_groups(token=token)
+        return self.group.get_user_groups(token=token, timeout=timeout)
 
     def create_group(
         self,
         token: Union[str, uuid.UUID],
         group_name: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
-        return self.group.create_group(token=token, group_name=group_name)
+        return self.group.create_group(
+            token=token, group_name=group_name, timeout=timeout
+        )
 
     def set_user_group(
         self,
@@ -277,15 +494,15 @@ class Bugout:
         user_type: Union[str, data.Role],
         username: Optional[str] = None,
         email: Optional[str] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroupUser:
-        self.group.timeout = timeout
         return self.group.set_user_group(
             token=token,
-            group_id=group_id,
-            user_type=data.Role(user_type),
+            group_id=_id(group_id),
+            user_type=_role(user_type),
             username=username,
             email=email,
+            timeout=timeout,
         )
 
     def delete_user_group(
@@ -294,42 +511,46 @@ class Bugout:
         group_id: Union[str, uuid.UUID],
         username: Optional[str] = None,
         email: Optional[str] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroupUser:
-        self.group.timeout = timeout
         return self.group.delete_user_group(
-            token=token, group_id=group_id, username=username, email=email
+            token=token,
+            group_id=_id(group_id),
+            username=username,
+            email=email,
+            timeout=timeout,
         )
 
     def get_group_members(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroupMembers:
-        self.group.timeout = timeout
-        return self.group.get_group_members(token=token, group_id=group_id)
+        return self.group.get_group_members(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
 
     def update_group(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
         group_name: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
         return self.group.update_group(
-            token=token, group_id=group_id, group_name=group_name
+            token=token, group_id=_id(group_id), group_name=group_name, timeout=timeout
         )
 
     def delete_group(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutGroup:
-        self.group.timeout = timeout
-        return self.group.delete_group(token=token, group_id=group_id)
+        return self.group.delete_group(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
 
     # Application handlers
     def create_application(
@@ -338,39 +559,45 @@ class Bugout:
         name: str,
         description: str,
         group_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplication:
-        self.group.timeout = timeout
         return self.group.create_application(
-            token=token, name=name, description=description, group_id=group_id
+            token=token,
+            name=name,
+            description=description,
+            group_id=_id(group_id),
+            timeout=timeout,
         )
 
     def get_application(
         self,
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplication:
-        self.group.timeout = timeout
-        return self.group.get_application(token=token, application_id=application_id)
+        return self.group.get_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
 
     def list_applications(
         self,
         token: Union[str, uuid.UUID],
         group_id: Optional[Union[str, uuid.UUID]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplications:
-        self.group.timeout = timeout
-        return self.group.list_applications(token=token, group_id=group_id)
+        return self.group.list_applications(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
 
     def delete_application(
         self,
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutApplication:
-        self.group.timeout = timeout
-        return self.group.delete_application(token=token, application_id=application_id)
+        return self.group.delete_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
 
     # Resource handlers
     def create_resource(
@@ -378,71 +605,79 @@ class Bugout:
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
         resource_data: Dict[str, Any],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
         return self.resource.create_resource(
-            token=token, application_id=application_id, resource_data=resource_data
+            token=token,
+            application_id=application_id,
+            resource_data=resource_data,
+            timeout=timeout,
         )
 
     def get_resource(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
-        return self.resource.get_resource(token=token, resource_id=resource_id)
+        return self.resource.get_resource(
+            token=token, resource_id=_id(resource_id), timeout=timeout
+        )
 
     def list_resources(
         self,
         token: Union[str, uuid.UUID],
         params: Optional[Dict[str, Any]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResources:
-        self.resource.timeout = timeout
-        return self.resource.list_resources(token=token, params=params)
+        return self.resource.list_resources(token=token, params=params, timeout=timeout)
 
     def update_resource(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
         resource_data: Dict[str, Any],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
         return self.resource.update_resource(
-            token=token, resource_id=resource_id, resource_data_update=resource_data
+            token=token,
+            resource_id=_id(resource_id),
+            resource_data_update=resource_data,
+            timeout=timeout,
         )
 
     def delete_resource(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResource:
-        self.resource.timeout = timeout
-        return self.resource.delete_resource(token=token, resource_id=resource_id)
+        return self.resource.delete_resource(
+            token=token, resource_id=_id(resource_id), timeout=timeout
+        )
 
     def get_resource_holders(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResourceHolders:
-        self.resource.timeout = timeout
-        return self.resource.get_resource_holders(token=token, resource_id=resource_id)
+        return self.resource.get_resource_holders(
+            token=token, resource_id=_id(resource_id), timeout=timeout
+        )
 
     def add_resource_holder_permissions(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
         holder_permissions: data.BugoutResourceHolder,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResourceHolders:
-        self.resource.timeout = timeout
         return self.resource.add_resource_holder_permissions(
-            token=token, resource_id=resource_id, holder_permissions=holder_permissions
+            token=token,
+            resource_id=_id(resource_id),
+            holder_permissions=holder_permissions,
+            timeout=timeout,
         )
 
     def delete_resource_holder_permissions(
@@ -450,35 +685,40 @@ class Bugout:
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
         holder_permissions: data.BugoutResourceHolder,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutResourceHolders:
-        self.resource.timeout = timeout
         return self.resource.delete_resource_holder_permissions(
-            token=token, resource_id=resource_id, holder_permissions=holder_permissions
+            token=token,
+            resource_id=_id(resource_id),
+            holder_permissions=holder_permissions,
+            timeout=timeout,
         )
 
     # Journal scopes handlers
+    @cached_get()
     def list_scopes(
-        self, token: Union[str, uuid.UUID], api: str, timeout: float = REQUESTS_TIMEOUT
+        self,
+        token: Union[str, uuid.UUID],
+        api: str,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutScopes:
-        self.journal.timeout = timeout
-        return self.journal.list_scopes(token=token, api=api)
+        return self.journal.list_scopes(token=token, api=api, timeout=timeout)
 
     def get_journal_permissions(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         holder_ids: Optional[List[Union[str, uuid.UUID]]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalPermissions:
-        self.journal.timeout = timeout
         return self.journal.get_journal_permissions(
             token=token,
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             holder_ids=holder_ids,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -486,11 +726,13 @@ class Bugout:
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutJournalScopeSpecs:
-        self.journal.timeout = timeout
-        return self.journal.get_journal_scopes(token=token, journal_id=journal_id)
+        return self.journal.get_journal_scopes(
+            token=token, journal_id=_id(journal_id), timeout=timeout
+        )
 
+    @invalidates_cache
     def update_journal_scopes(
         self,
         token: Union[str, uuid.UUID],
@@ -498,21 +740,22 @@ class Bugout:
         holder_type: Union[str, data.HolderType],
         holder_id: Union[str, uuid.UUID],
         permission_list: List[str],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalScopeSpecs:
-        self.journal.timeout = timeout
         return self.journal.update_journal_scopes(
             token=token,
-            journal_id=journal_id,
-            holder_type=data.HolderType(holder_type),
-            holder_id=holder_id,
+            journal_id=_id(journal_id),
+            holder_type=_holder(holder_type),
+            holder_id=_id(holder_id),
             permission_list=permission_list,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
+    @invalidates_cache
     def delete_journal_scopes(
         self,
         token: Union[str, uuid.UUID],
@@ -520,18 +763,18 @@ class Bugout:
         holder_type: Union[str, data.HolderType],
         holder_id: Union[str, uuid.UUID],
         permission_list: List[str],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalScopeSpecs:
-        self.journal.timeout = timeout
         return self.journal.delete_journal_scopes(
             token=token,
-            journal_id=journal_id,
-            holder_type=data.HolderType(holder_type),
-            holder_id=holder_id,
+            journal_id=_id(journal_id),
+            holder_type=_holder(holder_type),
+            holder_id=_id(holder_id),
             permission_list=permission_list,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -541,80 +784,81 @@ class Bugout:
         token: Union[str, uuid.UUID],
         name: str,
         journal_type: Optional[Union[str, data.JournalTypes]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
         if journal_type is None:
             journal_type = data.JournalTypes.DEFAULT
         return self.journal.create_journal(
             token=token,
             name=name,
-            journal_type=data.JournalTypes(journal_type),
-            auth_type=data.AuthType[auth_type],
+            journal_type=_journal_type(journal_type),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
     def list_journals(
         self,
         token: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournals:
-        self.journal.timeout = timeout
         return self.journal.list_journals(
-            token=token, auth_type=data.AuthType[auth_type], **kwargs
+            token=token, auth_type=_auth(auth_type), timeout=timeout, **kwargs
         )
 
     def get_journal(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
         return self.journal.get_journal(
             token=token,
-            journal_id=journal_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
+    @invalidates_cache
     def update_journal(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         name: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
         return self.journal.update_journal(
             token=token,
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             name=name,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
+    @invalidates_cache
     def delete_journal(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
         return self.journal.delete_journal(
             token=token,
-            journal_id=journal_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -629,21 +873,21 @@ class Bugout:
         context_url: Optional[str] = None,
         context_id: Optional[str] = None,
         context_type: Optional[str] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.create_entry(
             token=token,
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             title=title,
             content=content,
             tags=tags,
             context_url=context_url,
             context_id=context_id,
             context_type=context_type,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -652,20 +896,39 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entries: List[Dict[str, Any]],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
+        batch_size: int = 100,
+        max_concurrency: int = 8,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntries:
-        self.journal.timeout = timeout
-        entries_obj = data.BugoutJournalEntriesRequest(
-            entries=[data.BugoutJournalEntryRequest(**entry) for entry in entries]
-        )
-        return self.journal.create_entries_pack(
-            token=token,
-            journal_id=journal_id,
-            entries=entries_obj,
-            auth_type=data.AuthType[auth_type],
-            **kwargs,
+        """
+        Entries are sent in batches of batch_size, up to max_concurrency batches
+        in parallel. Created entries are returned in the order of batches.
+        """
+        batches = _entries_batches(entries, batch_size)
+
+        def create_batch(
+            entries_obj: data.BugoutJournalEntriesRequest,
+        ) -> data.BugoutJournalEntries:
+            return self.journal.create_entries_pack(
+                token=token,
+                journal_id=_id(journal_id),
+                entries=entries_obj,
+                auth_type=_auth(auth_type),
+                timeout=timeout,
+                **kwargs,
+            )
+
+        if len(batches) <= 1:
+            return create_batch(
+                batches[0] if batches else data.BugoutJournalEntriesRequest(entries=[])
+            )
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            results = list(executor.map(create_batch, batches))
+        return data.BugoutJournalEntries(
+            entries=[entry for result in results for entry in result.entries]
         )
 
     def get_entry(
@@ -673,16 +936,16 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.get_entry(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -690,15 +953,31 @@ class Bugout:
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntries:
-        self.journal.timeout = timeout
         return self.journal.get_entries(
             token=token,
-            journal_id=journal_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    def iter_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[data.BugoutJournalEntry]:
+        return self.journal.iter_entries(
+            token=token,
+            journal_id=_id(journal_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -707,16 +986,16 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntryContent:
-        self.journal.timeout = timeout
         return self.journal.get_entry_content(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -727,7 +1006,7 @@ class Bugout:
         entry_id: Union[str, uuid.UUID],
         title: str,
         content: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         tags: Optional[List[str]] = None,
         tags_action: TagsAction = TagsAction.merge,
         context_url: Optional[str] = None,
@@ -736,11 +1015,10 @@ class Bugout:
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntryContent:
-        self.journal.timeout = timeout
         return self.journal.update_entry_content(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
             title=title,
             content=content,
             tags=tags,
@@ -748,7 +1026,8 @@ class Bugout:
             context_url=context_url,
             context_id=context_id,
             context_type=context_type,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -757,16 +1036,16 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.delete_entry(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -775,10 +1054,11 @@ class Bugout:
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> List[Any]:
-        self.journal.timeout = timeout
-        return self.journal.get_most_used_tags(token=token, journal_id=journal_id)
+        return self.journal.get_most_used_tags(
+            token=token, journal_id=_id(journal_id), timeout=timeout
+        )
 
     def create_tags(
         self,
@@ -786,17 +1066,17 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         tags: List[str],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> List[Any]:
-        self.journal.timeout = timeout
         return self.journal.create_tags(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
             tags=tags,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -805,12 +1085,10 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entries_tags: List[Dict[str, Any]],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntries:
-        self.journal.timeout = timeout
-
         entries_tags_obj = data.BugoutJournalEntriesTagsRequest(
             entries=[
                 data.BugoutJournalEntryTagsRequest(**entry_tags)
@@ -819,9 +1097,10 @@ class Bugout:
         )
         return self.journal.create_entries_tags(
             token=token,
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             entries_tags=entries_tags_obj,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -830,16 +1109,16 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntryTags:
-        self.journal.timeout = timeout
         return self.journal.get_tags(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -849,17 +1128,17 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         tags: List[str],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> List[Any]:
-        self.journal.timeout = timeout
         return self.journal.update_tags(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
             tags=tags,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -869,17 +1148,17 @@ class Bugout:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         tag: str,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntryTags:
-        self.journal.timeout = timeout
         return self.journal.delete_tag(
             token=token,
-            journal_id=journal_id,
-            entry_id=entry_id,
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
             tag=tag,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -888,11 +1167,10 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entries_tags: List[Dict[str, Any]],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntries:
-        self.journal.timeout = timeout
         entries_tags_obj = data.BugoutJournalEntriesTagsRequest(
             entries=[
                 data.BugoutJournalEntryTagsRequest(**entry_tags)
@@ -901,9 +1179,10 @@ class Bugout:
         )
         return self.journal.delete_entries_tags(
             token=token,
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             entries_tags=entries_tags_obj,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -917,20 +1196,20 @@ class Bugout:
         blockchain: str,
         required_fields: List[Dict[str, Union[str, bool, int, list]]] = [],
         secondary_fields: Dict[str, Any] = {},
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntity:
-        self.journal.timeout = timeout
         return self.journal.create_entity(
             token=token,
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             title=title,
             address=address,
             blockchain=blockchain,
             required_fields=required_fields,
             secondary_fields=secondary_fields,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -939,17 +1218,16 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entities: List[Dict[str, Any]],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntities:
-        self.journal.timeout = timeout
-
         return self.journal.create_entities_pack(
             token=token,
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             entities=[data.BugoutJournalEntityRequest(**entity) for entity in entities],
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -958,16 +1236,16 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entity_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntity:
-        self.journal.timeout = timeout
         return self.journal.get_entity(
             token=token,
-            journal_id=journal_id,
-            entity_id=entity_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            entity_id=_id(entity_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -975,15 +1253,15 @@ class Bugout:
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntities:
-        self.journal.timeout = timeout
         return self.journal.get_entities(
             token=token,
-            journal_id=journal_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -997,21 +1275,21 @@ class Bugout:
         blockchain: str,
         required_fields: List[Dict[str, Union[str, bool, int, list]]] = [],
         secondary_fields: Dict[str, Any] = {},
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntity:
-        self.journal.timeout = timeout
         return self.journal.update_entity(
             token=token,
-            journal_id=journal_id,
-            entity_id=entity_id,
+            journal_id=_id(journal_id),
+            entity_id=_id(entity_id),
             title=title,
             address=address,
             blockchain=blockchain,
             required_fields=required_fields,
             secondary_fields=secondary_fields,
-            auth_type=data.AuthType[auth_type],
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -1020,16 +1298,16 @@ class Bugout:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         entity_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntity:
-        self.journal.timeout = timeout
         return self.journal.delete_entity(
             token=token,
-            journal_id=journal_id,
-            entity_id=entity_id,
-            auth_type=data.AuthType[auth_type],
+            journal_id=_id(journal_id),
+            entity_id=_id(entity_id),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
@@ -1043,7 +1321,7 @@ class Bugout:
         limit: int = 10,
         offset: int = 0,
         content: bool = True,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         order: SearchOrder = SearchOrder.DESCENDING,
         representation: Union[
             str, data.EntryRepresentationTypes
@@ -1051,57 +1329,62 @@ class Bugout:
         auth_type: str = data.AuthType.bearer.name,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutSearchResults:
-        self.journal.timeout = timeout
         return self.journal.search(
             token,
-            journal_id,
+            _id(journal_id),
             query,
             filters,
             limit,
             offset,
             content,
             order=order,
-            representation=data.EntryRepresentationTypes(representation),
-            auth_type=data.AuthType[auth_type],
+            representation=_representation(representation),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
             **kwargs,
         )
 
     # Public journals
+    @cached_get()
     def check_journal_public(
         self,
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> bool:
-        self.journal.timeout = timeout
-        return self.journal.check_journal_public(journal_id=journal_id, **kwargs)
+        return self.journal.check_journal_public(
+            journal_id=_id(journal_id), timeout=timeout, **kwargs
+        )
 
     def list_public_journals(
         self,
         user_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournals:
-        self.journal.timeout = timeout
-        return self.journal.list_public_journals(user_id=user_id, **kwargs)
+        return self.journal.list_public_journals(
+            user_id=_id(user_id), timeout=timeout, **kwargs
+        )
 
     def get_public_journal(
         self,
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournal:
-        self.journal.timeout = timeout
-        return self.journal.get_public_journal(journal_id=journal_id, **kwargs)
+        return self.journal.get_public_journal(
+            journal_id=_id(journal_id), timeout=timeout, **kwargs
+        )
 
     def get_public_journal_entries(
         self,
         journal_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntries:
-        self.journal.timeout = timeout
-        return self.journal.get_public_journal_entries(journal_id=journal_id, **kwargs)
+        return self.journal.get_public_journal_entries(
+            journal_id=_id(journal_id), timeout=timeout, **kwargs
+        )
 
     def create_public_journal_entry(
         self,
@@ -1112,18 +1395,18 @@ class Bugout:
         context_url: Optional[str] = None,
         context_id: Optional[str] = None,
         context_type: Optional[str] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.create_public_journal_entry(
-            journal_id=journal_id,
+            journal_id=_id(journal_id),
             title=title,
             content=content,
             tags=tags,
             context_url=context_url,
             context_id=context_id,
             context_type=context_type,
+            timeout=timeout,
             **kwargs,
         )
 
@@ -1131,24 +1414,28 @@ class Bugout:
         self,
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> List[str]:
-        self.journal.timeout = timeout
         return self.journal.touch_public_journal_entry(
-            journal_id=journal_id, entry_id=entry_id, **kwargs
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
+            timeout=timeout,
+            **kwargs,
         )
 
     def get_public_journal_entry(
         self,
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutJournalEntry:
-        self.journal.timeout = timeout
         return self.journal.get_public_journal_entry(
-            journal_id=journal_id, entry_id=entry_id, **kwargs
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
+            timeout=timeout,
+            **kwargs,
         )
 
     def public_search(
@@ -1159,19 +1446,19 @@ class Bugout:
         limit: int = 10,
         offset: int = 0,
         content: bool = True,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
         order: SearchOrder = SearchOrder.DESCENDING,
         **kwargs: Dict[str, Any],
     ) -> data.BugoutSearchResults:
-        self.journal.timeout = timeout
         return self.journal.public_search(
-            journal_id,
+            _id(journal_id),
             query,
             filters,
             limit,
             offset,
             content,
             order=order,
+            timeout=timeout,
             **kwargs,
         )
 
@@ -1180,7 +1467,8 @@ class Bugout:
         self,
         token: Union[str, uuid.UUID],
         group_id: Optional[Union[str, uuid.UUID]] = None,
-        timeout: float = REQUESTS_TIMEOUT,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
     ) -> data.BugoutHumbugIntegrationsList:
-        self.humbug.timeout = timeout
-        return self.humbug.get_humbug_integrations(token=token, group_id=group_id)
+        return self.humbug.get_humbug_integrations(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
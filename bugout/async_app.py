@@ -0,0 +1,411 @@
+import asyncio
+import uuid
+from typing import Any, Dict, List, Optional, Union
+
+import aiohttp  # type: ignore
+
+from . import data
+from .app import _auth, _entries_batches, _id, _representation, _role
+from .async_group import AsyncGroup
+from .async_journal import AsyncJournal
+from .journal import SearchOrder
+from .settings import BUGOUT_BROOD_URL, BUGOUT_SPIRE_URL, REQUESTS_TIMEOUT
+
+
+class AsyncBugout:
+    """
+    Asynchronous Bugout client for issuing many group and journal calls concurrently:
+
+        async with AsyncBugout() as bugout:
+            entries = await asyncio.gather(
+                *[bugout.get_entry(token, journal_id, entry_id) for entry_id in ids]
+            )
+
+    Requires optional dependency: pip install "bugout[async]"
+    """
+
+    def __init__(
+        self,
+        brood_api_url: str = BUGOUT_BROOD_URL,
+        spire_api_url: str = BUGOUT_SPIRE_URL,
+        limit_per_host: int = 64,
+    ) -> None:
+        self.brood_api_url = brood_api_url
+        self.spire_api_url = spire_api_url
+        self.limit_per_host = limit_per_host
+
+        # Created on first call, aiohttp session should be opened inside event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self.group = AsyncGroup(self._get_session, self.brood_api_url)
+        self.journal = AsyncJournal(self._get_session, self.spire_api_url)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.limit_per_host, ttl_dns_cache=300
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncBugout":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def brood_url(self):
+        return self.brood_api_url
+
+    @property
+    def spire_url(self):
+        return self.spire_api_url
+
+    # Group handlers
+    async def get_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        return await self.group.get_group(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
+
+    async def find_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        return await self.group.find_group(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
+
+    async def get_user_groups(
+        self, token: Union[str, uuid.UUID], timeout: float = REQUESTS_TIMEOUT
+    ) -> data.BugoutUserGroups:
+        return await self.group.get_user_groups(token=token, timeout=timeout)
+
+    async def create_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        return await self.group.create_group(
+            token=token, group_name=group_name, timeout=timeout
+        )
+
+    async def set_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        user_type: Union[str, data.Role],
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroupUser:
+        return await self.group.set_user_group(
+            token=token,
+            group_id=_id(group_id),
+            user_type=_role(user_type),
+            username=username,
+            email=email,
+            timeout=timeout,
+        )
+
+    async def delete_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroupUser:
+        return await self.group.delete_user_group(
+            token=token,
+            group_id=_id(group_id),
+            username=username,
+            email=email,
+            timeout=timeout,
+        )
+
+    async def get_group_members(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroupMembers:
+        return await self.group.get_group_members(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
+
+    async def update_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        return await self.group.update_group(
+            token=token, group_id=_id(group_id), group_name=group_name, timeout=timeout
+        )
+
+    async def delete_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutGroup:
+        return await self.group.delete_group(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
+
+    # Application handlers
+    async def create_application(
+        self,
+        token: Union[str, uuid.UUID],
+        name: str,
+        description: str,
+        group_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplication:
+        return await self.group.create_application(
+            token=token,
+            name=name,
+            description=description,
+            group_id=_id(group_id),
+            timeout=timeout,
+        )
+
+    async def get_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplication:
+        return await self.group.get_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
+
+    async def list_applications(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplications:
+        return await self.group.list_applications(
+            token=token, group_id=_id(group_id), timeout=timeout
+        )
+
+    async def delete_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> data.BugoutApplication:
+        return await self.group.delete_application(
+            token=token, application_id=application_id, timeout=timeout
+        )
+
+    # Journal handlers
+    async def list_journals(
+        self,
+        token: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutJournals:
+        return await self.journal.list_journals(
+            token=token,
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    # Entries
+    async def create_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        tags: List[str] = [],
+        context_url: Optional[str] = None,
+        context_id: Optional[str] = None,
+        context_type: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutJournalEntry:
+        return await self.journal.create_entry(
+            token=token,
+            journal_id=journal_id,
+            title=title,
+            content=content,
+            tags=tags,
+            context_url=context_url,
+            context_id=context_id,
+            context_type=context_type,
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    async def create_entries_pack(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entries: List[Dict[str, Any]],
+        timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        batch_size: int = 100,
+        max_concurrency: int = 8,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutJournalEntries:
+        """
+        Entries are sent in batches of batch_size, up to max_concurrency batches
+        at once. Created entries are returned in the order of batches.
+        """
+        batches = _entries_batches(entries, batch_size) or [
+            data.BugoutJournalEntriesRequest(entries=[])
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create_batch(
+            entries_obj: data.BugoutJournalEntriesRequest,
+        ) -> data.BugoutJournalEntries:
+            async with semaphore:
+                return await self.journal.create_entries_pack(
+                    token=token,
+                    journal_id=journal_id,
+                    entries=entries_obj,
+                    auth_type=_auth(auth_type),
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+        results = await asyncio.gather(*[create_batch(batch) for batch in batches])
+        return data.BugoutJournalEntries(
+            entries=[entry for result in results for entry in result.entries]
+        )
+
+    async def get_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutJournalEntry:
+        return await self.journal.get_entry(
+            token=token,
+            journal_id=journal_id,
+            entry_id=entry_id,
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    async def get_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutJournalEntries:
+        return await self.journal.get_entries(
+            token=token,
+            journal_id=journal_id,
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    # Tags
+    async def update_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tags: List[str],
+        timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> List[Any]:
+        return await self.journal.update_tags(
+            token=token,
+            journal_id=_id(journal_id),
+            entry_id=_id(entry_id),
+            tags=tags,
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    async def create_entries_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entries_tags: List[Dict[str, Any]],
+        timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutJournalEntries:
+        entries_tags_obj = data.BugoutJournalEntriesTagsRequest(
+            entries=[
+                data.BugoutJournalEntryTagsRequest(**entry_tags)
+                for entry_tags in entries_tags
+            ]
+        )
+        return await self.journal.create_entries_tags(
+            token=token,
+            journal_id=_id(journal_id),
+            entries_tags=entries_tags_obj,
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    # Search
+    async def search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        timeout: float = REQUESTS_TIMEOUT,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        representation: Union[
+            str, data.EntryRepresentationTypes
+        ] = data.EntryRepresentationTypes.ENTRY,
+        auth_type: str = data.AuthType.bearer.name,
+        **kwargs: Dict[str, Any],
+    ) -> data.BugoutSearchResults:
+        return await self.journal.search(
+            token,
+            journal_id,
+            query,
+            filters,
+            limit,
+            offset,
+            content,
+            order=order,
+            representation=_representation(representation),
+            auth_type=_auth(auth_type),
+            timeout=timeout,
+            **kwargs,
+        )
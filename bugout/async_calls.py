@@ -0,0 +1,116 @@
+"""
+Asynchronous calls to Bugout API built on aiohttp.
+
+Requires optional dependency: pip install "bugout[async]"
+"""
+import asyncio
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+import aiohttp  # type: ignore
+
+from .calls import _JSON_CT, _decode_error_detail, json_loads
+from .enums import METHOD_STRS, Method
+from .exceptions import BugoutResponseException, BugoutUnexpectedResponse
+
+
+def encode_params(params: Optional[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """
+    Encode query parameters the same way requests does it: None values are dropped
+    and lists are expanded into repeated keys. Booleans are sent as true/false.
+    """
+    encoded: List[Tuple[str, str]] = []
+    if params is None:
+        return encoded
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for v in values:
+            if v is None:
+                continue
+            if isinstance(v, bool):
+                v = "true" if v else "false"
+            encoded.append((key, str(v)))
+    return encoded
+
+
+def encode_form(data: Any) -> Any:
+    """
+    Encode form fields the same way requests does it: None values are dropped
+    and other values are sent as strings.
+    """
+    if not isinstance(data, dict):
+        return data
+    return {key: str(value) for key, value in data.items() if value is not None}
+
+
+async def make_request_raw(
+    session: aiohttp.ClientSession,
+    method: Union[str, Method],
+    url: str,
+    headers: Optional[Mapping[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Any] = None,
+    data: Optional[Any] = None,
+    timeout: Optional[float] = None,
+) -> bytes:
+    """
+    Send request to Bugout API with aiohttp session and return undecoded response
+    body. Exceptions are the same as for synchronous make_request.
+    """
+    verb = method if isinstance(method, str) else METHOD_STRS[method]
+    try:
+        async with session.request(
+            verb,
+            url,
+            headers=headers,
+            params=encode_params(params),
+            json=json,
+            data=encode_form(data),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status >= 400:
+                exception_detail = _decode_error_detail(
+                    await response.read(),
+                    response.content_type == _JSON_CT,
+                )
+                raise BugoutResponseException(
+                    "An exception occurred at Bugout API side",
+                    status_code=response.status,
+                    detail=exception_detail,
+                )
+            return await response.read()
+    except BugoutResponseException:
+        raise
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+        # Connection errors, timeouts, etc...
+        raise BugoutResponseException("Network error", status_code=599, detail=str(err))
+    except Exception as e:
+        raise BugoutUnexpectedResponse(str(e))
+
+
+async def make_request(
+    session: aiohttp.ClientSession,
+    method: Union[str, Method],
+    url: str,
+    headers: Optional[Mapping[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Any] = None,
+    data: Optional[Any] = None,
+    timeout: Optional[float] = None,
+) -> Any:
+    """
+    Send request to Bugout API with aiohttp session and return decoded JSON body.
+    """
+    body = await make_request_raw(
+        session=session,
+        method=method,
+        url=url,
+        headers=headers,
+        params=params,
+        json=json,
+        data=data,
+        timeout=timeout,
+    )
+    try:
+        return json_loads(body) if body else None
+    except ValueError as e:
+        raise BugoutUnexpectedResponse(f"Unparseable response body: {e}") from e
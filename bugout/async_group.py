@@ -0,0 +1,342 @@
+import uuid
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+import aiohttp  # type: ignore
+
+from .async_calls import make_request_raw
+from .calls import _DELETE, _GET, _POST, _PUT
+from .data import (
+    BugoutApplication,
+    BugoutApplications,
+    BugoutGroup,
+    BugoutGroupMembers,
+    BugoutGroupUser,
+    BugoutUserGroups,
+    Method,
+    Role,
+)
+from .exceptions import GroupInvalidParameters, InvalidUrlSpec
+from .settings import REQUESTS_TIMEOUT
+
+
+class AsyncGroup:
+    """
+    Represent a group from Bugout with asynchronous calls.
+    """
+
+    def __init__(
+        self,
+        get_session: Callable[[], aiohttp.ClientSession],
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> None:
+        if url is None:
+            raise InvalidUrlSpec("Invalid brood url specified")
+        self.url = url
+        self._base_url = url.rstrip("/")
+        self.timeout = timeout
+        self._get_session = get_session
+
+    async def _call_raw(
+        self,
+        method: Union[str, Method],
+        url: str,
+        headers: Optional[Mapping[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        result = await make_request_raw(
+            session=self._get_session(),
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        return result
+
+    async def get_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        get_group_url = f"{self._base_url}/group/{group_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_GET, url=get_group_url, headers=headers, timeout=timeout
+        )
+        return BugoutGroup.parse_raw(raw)
+
+    async def find_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        find_group_url = f"{self._base_url}/groups/find"
+        query_params = {"group_id": group_id}
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_GET,
+            url=find_group_url,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+        )
+        return BugoutGroup.parse_raw(raw)
+
+    async def get_user_groups(
+        self, token: Union[str, uuid.UUID], timeout: Optional[float] = None
+    ) -> BugoutUserGroups:
+        get_user_groups_url = f"{self._base_url}/groups"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_GET,
+            url=get_user_groups_url,
+            headers=headers,
+            timeout=timeout,
+        )
+        return BugoutUserGroups.parse_raw(raw)
+
+    async def create_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        create_group_url = f"{self._base_url}/group"
+        data = {
+            "group_name": group_name,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_POST,
+            url=create_group_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+        )
+        return BugoutGroup.parse_raw(raw)
+
+    async def set_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        user_type: Role,
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroupUser:
+        set_user_group_url = f"{self._base_url}/group/{group_id}/role"
+
+        if username is None and email is None:
+            raise GroupInvalidParameters(
+                "In order to update group role, at least one of username, or email must be specified"
+            )
+
+        data: Dict[str, Any] = {
+            "user_type": user_type.value,
+        }
+        if username is not None:
+            data.update({"username": username})
+        if email is not None:
+            data.update({"email": email})
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_POST,
+            url=set_user_group_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+        )
+        return BugoutGroupUser.parse_raw(raw)
+
+    async def delete_user_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        username: Optional[str] = None,
+        email: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroupUser:
+        """
+        TODO(kompotkot): Merge with set_user_group()
+        """
+        delete_user_group_url = f"{self._base_url}/group/{group_id}/role"
+
+        if username is None and email is None:
+            raise GroupInvalidParameters(
+                "In order to update group role, at least one of username, or email must be specified"
+            )
+
+        data = {}
+        if username is not None:
+            data.update({"username": username})
+        if email is not None:
+            data.update({"email": email})
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_DELETE,
+            url=delete_user_group_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+        )
+        return BugoutGroupUser.parse_raw(raw)
+
+    async def get_group_members(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroupMembers:
+        get_group_members_url = f"{self._base_url}/group/{group_id}/users"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_GET,
+            url=get_group_members_url,
+            headers=headers,
+            timeout=timeout,
+        )
+        return BugoutGroupMembers.parse_raw(raw)
+
+    async def update_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        update_group_url = f"{self._base_url}/group/{group_id}/name"
+        data = {
+            "group_name": group_name,
+        }
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_PUT,
+            url=update_group_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+        )
+        return BugoutGroup.parse_raw(raw)
+
+    async def delete_group(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutGroup:
+        delete_group_url = f"{self._base_url}/group/{group_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_DELETE,
+            url=delete_group_url,
+            headers=headers,
+            timeout=timeout,
+        )
+        return BugoutGroup.parse_raw(raw)
+
+    async def create_application(
+        self,
+        token: Union[str, uuid.UUID],
+        name: str,
+        description: str,
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutApplication:
+        applications_url = f"{self._base_url}/applications"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        data = {
+            "name": name,
+            "description": description,
+            "group_id": group_id,
+        }
+        raw = await self._call_raw(
+            method=_POST,
+            url=applications_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
+        )
+        return BugoutApplication.parse_raw(raw)
+
+    async def get_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutApplication:
+        applications_url = f"{self._base_url}/applications/{application_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_GET, url=applications_url, headers=headers, timeout=timeout
+        )
+        return BugoutApplication.parse_raw(raw)
+
+    async def list_applications(
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[float] = None,
+    ) -> BugoutApplications:
+        applications_url = f"{self._base_url}/applications"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        query_params = {
+            "group_id": group_id,
+        }
+        raw = await self._call_raw(
+            method=_GET,
+            url=applications_url,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+        )
+        return BugoutApplications.parse_raw(raw)
+
+    async def delete_application(
+        self,
+        token: Union[str, uuid.UUID],
+        application_id: Union[str, uuid.UUID],
+        timeout: Optional[float] = None,
+    ) -> BugoutApplication:
+        applications_url = f"{self._base_url}/applications/{application_id}"
+        headers = {
+            "Authorization": f"Bearer {token}",
+        }
+        raw = await self._call_raw(
+            method=_DELETE,
+            url=applications_url,
+            headers=headers,
+            timeout=timeout,
+        )
+        return BugoutApplication.parse_raw(raw)
@@ -0,0 +1,327 @@
+"""
+Asynchronous version of the job queue from bugout.jobs, independent journal calls (e.g. creating
+many jobs or marking them as complete) run concurrently over one aiohttp session.
+
+Requires optional dependency: pip install "bugout[async]"
+"""
+
+import asyncio
+from datetime import datetime
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .app import _auth
+from .async_app import AsyncBugout
+from .async_calls import make_request
+from .data import AuthType, BugoutSearchResultWithEntryID, Method
+from .jobs import (
+    DEFAULT_CONTEXT_TYPE,
+    DEFAULT_CURSOR_CONTEXT_TYPE,
+    DEFAULT_FAILURE_TAG,
+    DEFAULT_SUCCESS_TAG,
+    DEFAULT_TAGS_BATCH_SIZE,
+    JobView,
+    iso_created_at,
+    job_from_result,
+    view_query_components,
+)
+from .journal import SearchOrder
+from .settings import BUGOUT_BROOD_URL, BUGOUT_SPIRE_URL, REQUESTS_TIMEOUT
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def execute_in_queue(
+    func: Callable[[T], Awaitable[R]], params: Iterable[T], workers: int = 8
+) -> List[R]:
+    """
+    Call func for each of params with at most workers calls in flight, worker tasks take params
+    from a shared queue. Results are returned in the order of params. The first failure cancels
+    the remaining calls and is raised.
+    """
+    items = list(params)
+    results: List[Any] = [None] * len(items)
+    queue: "asyncio.Queue[Tuple[int, T]]" = asyncio.Queue()
+    for index_item in enumerate(items):
+        queue.put_nowait(index_item)
+
+    async def worker() -> None:
+        while True:
+            try:
+                index, item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results[index] = await func(item)
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(min(workers, len(items)))]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # Other workers would keep taking params from the queue after the caller saw the error
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return results
+
+
+class AsyncBugoutJobQueue:
+    """
+    Job queue in a Bugout journal with asynchronous calls, see BugoutJobQueue for the description
+    of how jobs are stored:
+
+        async with AsyncBugoutJobQueue(token, journal_id) as queue:
+            await queue.create_jobs([(context_id, title, content) for ... in ...])
+            for job in await queue.list_jobs(JobView.REMAINING):
+                ...
+    """
+
+    def __init__(
+        self,
+        bugout_token: str,
+        journal_id: str,
+        context_type: str = DEFAULT_CONTEXT_TYPE,
+        success_tag: str = DEFAULT_SUCCESS_TAG,
+        failure_tag: str = DEFAULT_FAILURE_TAG,
+        cursor_context_type: str = DEFAULT_CURSOR_CONTEXT_TYPE,
+        brood_api_url: str = BUGOUT_BROOD_URL,
+        spire_api_url: str = BUGOUT_SPIRE_URL,
+        write_timeout: float = REQUESTS_TIMEOUT,
+        auth_type: str = AuthType.bearer.name,
+        limit_per_host: int = 32,
+        cursor_ttl: float = 30.0,
+    ) -> None:
+        self.bugout_token = bugout_token
+        self.journal_id = journal_id
+        self.context_type = context_type
+        self.success_tag = success_tag
+        self.failure_tag = failure_tag
+        self.cursor_context_type = cursor_context_type
+        # Search queries of job views are fixed by the queue parameters
+        self._base_query_by_view = {
+            view: " ".join(
+                view_query_components(view, context_type, success_tag, failure_tag)
+            )
+            for view in JobView
+        }
+        self.client = AsyncBugout(
+            brood_api_url, spire_api_url, limit_per_host=limit_per_host
+        )
+        self.write_timeout = write_timeout
+        self.auth_type = auth_type
+        self._entries_url = (
+            f'{spire_api_url.rstrip("/")}/journals/{self.journal_id}/entries'
+        )
+        self._cursor_tag = f"cursor:{cursor_context_type}"
+        self._cursor_query = f"context_type:{cursor_context_type}"
+        self._cursor_headers = {
+            "Authorization": f"{_auth(auth_type).value} {bugout_token}"
+        }
+
+        # Monotonic time of lookup and created_at of the most recent cursor
+        self.cursor_ttl = cursor_ttl
+        self._cursor_cache: Optional[Tuple[float, Optional[str]]] = None
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    async def __aenter__(self) -> "AsyncBugoutJobQueue":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def create_job(
+        self, context_id: str, job_title: str, job_content: str
+    ) -> None:
+        """
+        Create a job in the jobs journal.
+        """
+        await self.client.create_entry(
+            self.bugout_token,
+            self.journal_id,
+            job_title,
+            job_content,
+            tags=[self.context_type, f"{self.context_type}:{context_id}"],
+            context_id=context_id,
+            context_type=self.context_type,
+            timeout=self.write_timeout,
+            auth_type=self.auth_type,
+        )
+
+    async def create_jobs(
+        self, specs: Iterable[Tuple[str, str, str]], workers: int = 8
+    ) -> None:
+        """
+        Create jobs from (context_id, job_title, job_content) specs, up to workers at once.
+        """
+
+        async def create(spec: Tuple[str, str, str]) -> None:
+            await self.create_job(*spec)
+
+        await execute_in_queue(create, specs, workers)
+
+    async def update_cursor(self, created_at: datetime) -> None:
+        """
+        Update the position of the cursor in the journal to the given "created_at" time.
+        """
+        body = {
+            "title": self._cursor_tag,
+            "content": "",
+            "tags": [self._cursor_tag],
+            "context_type": self.cursor_context_type,
+            "created_at": created_at.isoformat(),
+        }
+        await make_request(
+            session=self.client._get_session(),
+            method=Method.post,
+            url=self._entries_url,
+            headers=self._cursor_headers,
+            json=body,
+            timeout=self.write_timeout,
+        )
+        # The most recent cursor could be newer than the written one, it is looked up again
+        self.invalidate_cursor()
+
+    def invalidate_cursor(self) -> None:
+        """
+        Drop cached cursor position, e.g. after another worker moved the cursor. The next listing
+        with use_cursor searches for the cursor again.
+        """
+        self._cursor_cache = None
+
+    async def _get_cursor_created_at(self) -> Optional[str]:
+        """
+        Return creation time of the most recent cursor or None if there is no cursor yet, cached
+        for cursor_ttl seconds.
+        """
+        if self._cursor_cache is not None:
+            cached_at, created_at = self._cursor_cache
+            if time.monotonic() - cached_at < self.cursor_ttl:
+                return created_at
+
+        cursor_results = await self.client.search(
+            self.bugout_token,
+            self.journal_id,
+            self._cursor_query,
+            limit=1,
+            content=False,
+            order=SearchOrder.DESCENDING,
+            auth_type=self.auth_type,
+        )
+        created_at = None
+        if cursor_results.results:
+            created_at = iso_created_at(cursor_results.results[0].created_at)
+        self._cursor_cache = (time.monotonic(), created_at)
+        return created_at
+
+    async def list_jobs(
+        self,
+        job_view: JobView = JobView.REMAINING,
+        use_cursor: bool = True,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[BugoutSearchResultWithEntryID]:
+        """
+        List jobs from the given job view in chronological order, arguments are the same as for
+        BugoutJobQueue.list_jobs.
+        """
+        query = self._base_query_by_view[job_view]
+        if use_cursor:
+            created_at = await self._get_cursor_created_at()
+            if created_at is not None:
+                query = f"{query} created_at:>{created_at}"
+
+        if after is not None:
+            query = f"{query} created_at:>{iso_created_at(after)}"
+        job_results = await self.client.search(
+            self.bugout_token,
+            self.journal_id,
+            query,
+            limit=limit,
+            offset=offset,
+            content=True,
+            order=SearchOrder.ASCENDING,
+            auth_type=self.auth_type,
+        )
+        return [job_from_result(raw_result) for raw_result in job_results.results]
+
+    async def job_complete(self, job_id: str) -> None:
+        """
+        Mark a job as successfully completed.
+        """
+        await self.client.update_tags(
+            self.bugout_token,
+            self.journal_id,
+            job_id,
+            tags=[self.success_tag],
+            timeout=self.write_timeout,
+            auth_type=self.auth_type,
+        )
+
+    async def job_failed(self, job_id: str) -> None:
+        """
+        Mark a job as failed.
+        """
+        await self.client.update_tags(
+            self.bugout_token,
+            self.journal_id,
+            job_id,
+            tags=[self.failure_tag],
+            timeout=self.write_timeout,
+            auth_type=self.auth_type,
+        )
+
+    async def jobs_complete(
+        self,
+        job_ids: Iterable[str],
+        workers: int = 8,
+        batch_size: int = DEFAULT_TAGS_BATCH_SIZE,
+    ) -> None:
+        """
+        Mark jobs as successfully completed with one bulk request per batch_size jobs, up to
+        workers batches at once.
+        """
+        await self._tag_jobs(self.success_tag, job_ids, workers, batch_size)
+
+    async def jobs_failed(
+        self,
+        job_ids: Iterable[str],
+        workers: int = 8,
+        batch_size: int = DEFAULT_TAGS_BATCH_SIZE,
+    ) -> None:
+        """
+        Mark jobs as failed with one bulk request per batch_size jobs, up to workers batches at
+        once.
+        """
+        await self._tag_jobs(self.failure_tag, job_ids, workers, batch_size)
+
+    async def _tag_jobs(
+        self, tag: str, job_ids: Iterable[str], workers: int, batch_size: int
+    ) -> None:
+        job_ids = list(job_ids)
+        batches = [
+            job_ids[i : i + batch_size] for i in range(0, len(job_ids), batch_size)
+        ]
+
+        async def tag_batch(batch: List[str]) -> None:
+            await self.client.create_entries_tags(
+                self.bugout_token,
+                self.journal_id,
+                [{"entry_id": job_id, "tags": [tag]} for job_id in batch],
+                timeout=self.write_timeout,
+                auth_type=self.auth_type,
+            )
+
+        await execute_in_queue(tag_batch, batches, workers)
@@ -0,0 +1,312 @@
+import json
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import aiohttp  # type: ignore
+
+from .async_calls import make_request, make_request_raw
+from .data import (
+    AuthType,
+    BugoutJournalEntries,
+    BugoutJournalEntriesRequest,
+    BugoutJournalEntriesTagsRequest,
+    BugoutJournalEntry,
+    BugoutJournals,
+    BugoutSearchResults,
+    EntryRepresentationTypes,
+    Method,
+    parse_search_results,
+)
+from .exceptions import InvalidUrlSpec
+from .journal import SearchOrder
+from .settings import REQUESTS_TIMEOUT
+
+
+class AsyncJournal:
+    """
+    Represent a journal from Bugout with asynchronous calls.
+    """
+
+    def __init__(
+        self,
+        get_session: Callable[[], aiohttp.ClientSession],
+        url: Optional[str] = None,
+        timeout: float = REQUESTS_TIMEOUT,
+    ) -> None:
+        if url is None:
+            raise InvalidUrlSpec("Invalid spire url specified")
+        self.url = url
+        self._base_url = url.rstrip("/")
+        self.timeout = timeout
+        self._get_session = get_session
+
+    async def _call(
+        self,
+        method: Union[str, Method],
+        path: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ):
+        url = f"{self._base_url}/{path}"
+        result = await make_request(
+            session=self._get_session(),
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        return result
+
+    async def _call_raw(
+        self,
+        method: Union[str, Method],
+        path: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        url = f"{self._base_url}/{path}"
+        result = await make_request_raw(
+            session=self._get_session(),
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        return result
+
+    # Journal module
+    async def list_journals(
+        self,
+        token: Union[str, uuid.UUID],
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutJournals:
+        journal_path = "journals"
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        result = await self._call(
+            method=Method.get, path=journal_path, headers=headers, timeout=timeout
+        )
+        return BugoutJournals(**result)
+
+    # Entry module
+    async def create_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        title: str,
+        content: str,
+        tags: List[str] = [],
+        context_url: Optional[str] = None,
+        context_id: Optional[str] = None,
+        context_type: Optional[str] = None,
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutJournalEntry:
+        entry_path = f"journals/{journal_id}/entries"
+        json = {
+            "title": title,
+            "content": content,
+            "tags": tags,
+            "context_url": context_url,
+            "context_id": context_id,
+            "context_type": context_type,
+        }
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        raw = await self._call_raw(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+        )
+        return BugoutJournalEntry.parse_raw(raw)
+
+    async def create_entries_pack(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entries: BugoutJournalEntriesRequest,
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutJournalEntries:
+        entry_path = f"journals/{journal_id}/bulk"
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        json = {
+            "entries": [
+                {
+                    "title": entry.title,
+                    "content": entry.content,
+                    "tags": entry.tags,
+                    "context_url": entry.context_url,
+                    "context_id": entry.context_id,
+                    "context_type": entry.context_type,
+                }
+                for entry in entries.entries
+            ]
+        }
+        raw = await self._call_raw(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+        )
+        return BugoutJournalEntries.parse_raw(raw)
+
+    async def get_entry(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutJournalEntry:
+        entry_id_path = f"journals/{journal_id}/entries/{entry_id}"
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        raw = await self._call_raw(
+            method=Method.get, path=entry_id_path, headers=headers, timeout=timeout
+        )
+        return BugoutJournalEntry.parse_raw(raw)
+
+    async def get_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutJournalEntries:
+        entry_path = f"journals/{journal_id}/entries"
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        raw = await self._call_raw(
+            method=Method.get, path=entry_path, headers=headers, timeout=timeout
+        )
+        return BugoutJournalEntries.parse_raw(raw)
+
+    # Tags module
+    async def update_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entry_id: Union[str, uuid.UUID],
+        tags: List[str],
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> List[Any]:
+        tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
+        json = {"tags": tags}
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        result = await self._call(
+            method=Method.put,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+        )
+        return result
+
+    async def create_entries_tags(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        entries_tags: BugoutJournalEntriesTagsRequest,
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutJournalEntries:
+        tags_path = f"journals/{journal_id}/bulk_entries_tags"
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        json_body = json.loads(entries_tags.json())
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        result = await self._call(
+            method=Method.post,
+            path=tags_path,
+            headers=headers,
+            json=json_body,
+            timeout=timeout,
+        )
+        return BugoutJournalEntries(entries=result)
+
+    # Search module
+    async def search(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        query: str,
+        filters: Optional[List[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        content: bool = True,
+        order: SearchOrder = SearchOrder.DESCENDING,
+        representation: EntryRepresentationTypes = EntryRepresentationTypes.ENTRY,
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[float] = None,
+        **kwargs: Dict[str, Any],
+    ) -> BugoutSearchResults:
+        search_path = f"journals/{journal_id}/search"
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+        query_params = {
+            "q": query,
+            "filters": filters if filters is not None else [],
+            "limit": limit,
+            "offset": offset,
+            "content": content,
+            "order": order.value,
+            "representation": representation.value,
+        }
+        result = await self._call(
+            method=Method.get,
+            path=search_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
+        )
+        return parse_search_results(result, representation)
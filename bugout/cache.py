@@ -0,0 +1,113 @@
+import copy
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, List, Optional, Tuple, TypeVar, cast
+
+from .settings import BUGOUT_CACHE_TTL_SECONDS
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache, values expire after ttl seconds. Least recently
+    stored values are evicted when maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = BUGOUT_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def cached_get(ttl: Optional[float] = None) -> Callable[[F], F]:
+    """
+    Cache results of idempotent Bugout GET method in instance's _cache.
+
+    Key is built from method name and its arguments except timeout, token is
+    stored as a hash. Calls with extra keyword arguments (e.g. custom headers)
+    are not cached. Cache is disabled when TTL is 0.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cache: TTLCache = self._cache
+            cache_ttl = ttl if ttl is not None else cache.ttl
+            bound = signature.bind(self, *args, **kwargs)
+            if cache_ttl <= 0 or bound.arguments.get("kwargs"):
+                return func(self, *args, **kwargs)
+
+            key_parts: List[Hashable] = [func.__name__]
+            for name, value in bound.arguments.items():
+                if name in ("self", "timeout", "kwargs"):
+                    continue
+                if name == "token":
+                    value = hashlib.sha256(str(value).encode()).hexdigest()
+                key_parts.append((name, _freeze(value)))
+            key = tuple(key_parts)
+
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(self, *args, **kwargs)
+                cache.set(key, result, ttl=cache_ttl)
+            # Callers get their own copy, changes to it do not leak into next cache hits
+            return copy.deepcopy(result)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def invalidates_cache(func: F) -> F:
+    """
+    Drop instance's _cache after Bugout method which changes resources, so reads through the same
+    client observe its own writes.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._cache.clear()
+
+    return cast(F, wrapper)
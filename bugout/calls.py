@@ -1,34 +1,455 @@
-from typing import Any, Dict
+import atexit
+import gzip
+from typing import Any, Dict, Iterator, Mapping, NoReturn, Optional, Tuple, Union
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
 
-from .data import Method
+try:
+    # Faster (de)serialization of large bodies: pip install "bugout[speedups]"
+    from orjson import dumps as json_dumps  # type: ignore
+    from orjson import loads as json_loads  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from json import dumps as _stdlib_json_dumps
+    from json import loads as json_loads  # type: ignore
+
+    def json_dumps(obj: Any) -> bytes:  # type: ignore
+        return _stdlib_json_dumps(obj).encode("utf-8")
+
+    ORJSON_AVAILABLE = False
+
+from .enums import METHOD_STRS, Method
 from .exceptions import BugoutResponseException, BugoutUnexpectedResponse
+from .settings import BUGOUT_GZIP_MIN_BYTES, BUGOUT_POOL_MAXSIZE, BUGOUT_RETRIES
+
+# Timeout in seconds, or (connect, read) pair to fail fast on stuck connects
+TimeoutType = Union[float, Tuple[float, float]]
+
+# Plain HTTP verbs, passed by hot call sites instead of Method enum members
+_GET, _POST, _PUT, _DELETE = "get", "post", "put", "delete"
+
+# Error bodies above this size are kept as truncated text instead of being parsed
+_ERROR_DETAIL_MAX_BYTES = 64 * 1024
+_JSON_CT = "application/json"
+
+
+class HttpxBackend:
+    """
+    HTTP/2 transport for Bugout API calls built on httpx.Client. It multiplexes
+    concurrent requests to the same host over one connection and could be used
+    instead of requests.Session anywhere a session is accepted.
+
+    Requires optional dependency: pip install "bugout[httpx]"
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_keepalive_connections: int = 20,
+        max_connections: int = 64,
+    ) -> None:
+        import httpx  # type: ignore
+
+        self._httpx = httpx
+        self.client = httpx.Client(
+            http2=http2,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[TimeoutType] = None,
+    ) -> Any:
+        httpx = self._httpx
+        request_timeout = self._request_timeout(timeout)
+        # Match requests behaviour, which drops None values from query and form
+        if params is not None:
+            params = {k: v for k, v in params.items() if v is not None}
+        content = None
+        if isinstance(data, dict):
+            data = {k: v for k, v in data.items() if v is not None}
+        elif data is not None:
+            content, data = data, None
+        try:
+            response = self.client.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json,
+                data=data,
+                content=content,
+                timeout=request_timeout,
+            )
+        except httpx.HTTPError as err:
+            raise requests.exceptions.ConnectionError(str(err)) from err
+        return response
+
+    def request_stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[TimeoutType] = None,
+    ) -> "HttpxStreamResponse":
+        """
+        Send request and return response with unread body, see make_request_stream.
+        """
+        httpx = self._httpx
+        if params is not None:
+            params = {k: v for k, v in params.items() if v is not None}
+        try:
+            request = self.client.build_request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                timeout=self._request_timeout(timeout),
+            )
+            response = self.client.send(request, stream=True)
+        except httpx.HTTPError as err:
+            raise requests.exceptions.ConnectionError(str(err)) from err
+        return HttpxStreamResponse(response)
+
+    def _request_timeout(self, timeout: Optional[TimeoutType]) -> Any:
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return httpx.Timeout(read_timeout, connect=connect_timeout)
+        elif timeout is not None:
+            return timeout
+        return httpx.USE_CLIENT_DEFAULT
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class _ByteChunksReader:
+    """
+    File-like reader over iterator of byte chunks.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class HttpxStreamResponse:
+    """
+    Streamed httpx response with the parts of requests.Response interface used by
+    make_request_stream callers: body is read incrementally from raw, which is
+    decoded the same way as requests does with raw.decode_content.
+    """
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self.status_code: int = response.status_code
+        self.headers = response.headers
+        self.raw = _ByteChunksReader(response.iter_bytes())
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self) -> "HttpxStreamResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+SessionType = Union[requests.Session, HttpxBackend]
 
 
-def make_request(method: Method, url: str, **kwargs) -> Any:
+def build_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = BUGOUT_POOL_MAXSIZE,
+    retries: int = BUGOUT_RETRIES,
+) -> requests.Session:
+    """
+    Build requests.Session with keep-alive connection pool of pool_maxsize
+    connections per host, size it to number of threads sharing the session
+    to avoid opening new sockets when pool is full. Idempotent requests
+    are retried on 502, 503 and 504 responses with backoff, final response is
+    returned as is and handled by make_request. POST requests are not retried,
+    otherwise entries could be created twice.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Used by make_request when no session is passed
+_session = build_session()
+
+
+@atexit.register
+def _close_session() -> None:
+    _session.close()
+
+
+def configure_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = BUGOUT_POOL_MAXSIZE,
+    retries: int = BUGOUT_RETRIES,
+) -> None:
+    """
+    Replace module level session used for calls without explicit session and by
+    clients created after this call.
+    """
+    global _session
+    _session.close()
+    _session = build_session(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, retries=retries
+    )
+
+
+def shared_session() -> requests.Session:
+    """
+    Return module level session, clients created without session of their own share its
+    connection pool, so TLS connections are opened once per host in process instead of once per
+    client. Call configure_session before creating clients to resize it.
+    """
+    return _session
+
+
+def _decode_error_detail(content: bytes, is_json: bool) -> Any:
+    """
+    Parse error response body once. Detail field is returned for JSON bodies
+    and raw text for everything else, including malformed JSON. Bodies larger
+    than _ERROR_DETAIL_MAX_BYTES are not decoded, only their beginning is kept.
+    """
+    if len(content) > _ERROR_DETAIL_MAX_BYTES:
+        return content[:_ERROR_DETAIL_MAX_BYTES].decode("utf-8", errors="replace")
+    if is_json:
+        try:
+            body = json_loads(content)
+        except ValueError:
+            return content.decode("utf-8", errors="replace")
+        if isinstance(body, dict) and "detail" in body:
+            return body["detail"]
+        return body
+    return content.decode("utf-8", errors="replace")
+
+
+def _extract_detail(response: Any) -> Any:
+    # Content-Type could carry parameters, e.g. application/json; charset=utf-8
+    return _decode_error_detail(
+        response.content,
+        response.headers.get("Content-Type", "").startswith(_JSON_CT),
+    )
+
+
+def _raise(response: Any) -> NoReturn:
+    """
+    Raise BugoutResponseException for error response. Kept out of request
+    functions, so successful calls do not pay for error handling.
+    """
+    try:
+        exception_detail = _extract_detail(response)
+    finally:
+        # Release connection of streamed responses back to the pool
+        response.close()
+    raise BugoutResponseException(
+        "An exception occurred at Bugout API side",
+        status_code=response.status_code,
+        detail=exception_detail,
+    )
+
+
+def _raise_bugout(err: requests.exceptions.RequestException) -> NoReturn:
+    """
+    Convert requests exception into BugoutResponseException.
+    """
+    if err.response is not None:
+        _raise(err.response)
+    # Connection errors, timepouts, etc...
+    raise BugoutResponseException(
+        "Network error", status_code=599, detail=str(err)
+    ) from err
+
+
+def _send(
+    method: Union[str, Method],
+    url: str,
+    session: Optional[SessionType] = None,
+    headers: Optional[Mapping[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Any] = None,
+    data: Optional[Any] = None,
+    timeout: Optional[TimeoutType] = None,
+) -> Any:
+    verb = method if isinstance(method, str) else METHOD_STRS[method]
     try:
-        response = requests.request(method.value, url=url, **kwargs)
-        response.raise_for_status()
+        if json is not None and (ORJSON_AVAILABLE or BUGOUT_GZIP_MIN_BYTES > 0):
+            # Send body serialized by orjson instead of stdlib json used by requests
+            data = json_dumps(json)
+            json = None
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        if (
+            BUGOUT_GZIP_MIN_BYTES > 0
+            and isinstance(data, bytes)
+            and len(data) >= BUGOUT_GZIP_MIN_BYTES
+        ):
+            data = gzip.compress(data, compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        requester = session if session is not None else _session
+        response = requester.request(
+            verb,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout,
+        )
     except requests.exceptions.RequestException as err:
-        r = err.response
-        if err.response is None:
-            # Connection errors, timepouts, etc...
-            raise BugoutResponseException(
-                "Network error", status_code=599, detail=str(err)
+        _raise_bugout(err)
+    except Exception as e:
+        raise BugoutUnexpectedResponse(str(e)) from e
+    if response.status_code >= 400:
+        _raise(response)
+    return response
+
+
+def make_request(
+    method: Union[str, Method],
+    url: str,
+    session: Optional[SessionType] = None,
+    headers: Optional[Mapping[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Any] = None,
+    data: Optional[Any] = None,
+    timeout: Optional[TimeoutType] = None,
+) -> Any:
+    """
+    Send request to Bugout API. Method could be passed as Method enum or plain HTTP
+    verb string. If session is not provided, module level pooled session is used,
+    so keep-alive connections are reused between calls.
+    """
+    response = _send(
+        method=method,
+        url=url,
+        session=session,
+        headers=headers,
+        params=params,
+        json=json,
+        data=data,
+        timeout=timeout,
+    )
+    try:
+        return json_loads(response.content) if response.content else None
+    except ValueError as e:
+        raise BugoutUnexpectedResponse(f"Unparseable response body: {e}") from e
+
+
+def make_request_raw(
+    method: Union[str, Method],
+    url: str,
+    session: Optional[SessionType] = None,
+    headers: Optional[Mapping[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Any] = None,
+    data: Optional[Any] = None,
+    timeout: Optional[TimeoutType] = None,
+) -> bytes:
+    """
+    Same as make_request, but returns undecoded response body, so it could be
+    parsed directly into model with Model.parse_raw.
+    """
+    response = _send(
+        method=method,
+        url=url,
+        session=session,
+        headers=headers,
+        params=params,
+        json=json,
+        data=data,
+        timeout=timeout,
+    )
+    return response.content
+
+
+def make_request_stream(
+    method: Union[str, Method],
+    url: str,
+    session: Optional[SessionType] = None,
+    headers: Optional[Mapping[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: Optional[TimeoutType] = None,
+) -> Union[requests.Response, HttpxStreamResponse]:
+    """
+    Send request to Bugout API and return response with unread body, so it could
+    be parsed incrementally from response.raw. Caller should close the response.
+    """
+    verb = method if isinstance(method, str) else METHOD_STRS[method]
+    try:
+        requester = session if session is not None else _session
+        response: Union[requests.Response, HttpxStreamResponse]
+        if isinstance(requester, HttpxBackend):
+            response = requester.request_stream(
+                verb, url, headers=headers, params=params, timeout=timeout
             )
-        if r.headers.get("Content-Type") == "application/json":  # type: ignore
-            exception_detail = r.json()["detail"]  # type: ignore
         else:
-            exception_detail = r.text  # type: ignore
-        raise BugoutResponseException(
-            "An exception occurred at Bugout API side",
-            status_code=r.status_code,  # type: ignore
-            detail=exception_detail,
-        )
+            response = requester.request(
+                verb,
+                url=url,
+                headers=headers,
+                params=params,
+                timeout=timeout,
+                stream=True,
+            )
+    except requests.exceptions.RequestException as err:
+        _raise_bugout(err)
     except Exception as e:
-        raise BugoutUnexpectedResponse(str(e))
-    return response.json()
+        raise BugoutUnexpectedResponse(str(e)) from e
+    if response.status_code >= 400:
+        _raise(response)
+    if isinstance(response, requests.Response):
+        # Let urllib3 decode gzip encoded body while it is read from the socket
+        response.raw.decode_content = True
+    return response
 
 
 def ping(url: str) -> Dict[str, Any]:
@@ -1,59 +1,46 @@
 import uuid
 from datetime import datetime
-from enum import Enum, unique
 from typing import Any, Dict, List, Optional, Set, Union
 
-from pydantic import BaseModel, Extra, Field, root_validator
-
-
-@unique
-class Method(Enum):
-    delete = "delete"
-    get = "get"
-    post = "post"
-    put = "put"
-
-
-@unique
-class Role(Enum):
-    owner = "owner"
-    member = "member"
-
-
-@unique
-class TokenType(Enum):
-    bugout = "bugout"
-    slack = "slack"
-    github = "github"
-
-
-@unique
-class HolderType(Enum):
-    user = "user"
-    group = "group"
-
-
-class ResourcePermissions(Enum):
-    ADMIN = "admin"
-    CREATE = "create"
-    READ = "read"
-    UPDATE = "update"
-    DELETE = "delete"
-
-
-class AuthType(Enum):
-    bearer = "Bearer"
-    web3 = "Web3"
+from pydantic import BaseModel, Extra, Field, parse_obj_as, root_validator
+
+try:
+    from orjson import loads as json_loads  # type: ignore
+except ImportError:
+    from json import loads as json_loads  # type: ignore
+
+# Enums live in separate module, so they could be used without importing pydantic
+from .enums import (
+    METHOD_STRS,
+    AuthType,
+    EntryRepresentationTypes,
+    HolderType,
+    JournalTypes,
+    Method,
+    ResourcePermissions,
+    Role,
+    TokenType,
+)
+
+
+class BugoutModel(BaseModel):
+    """
+    Base for models parsed with parse_raw directly from response body, JSON is
+    decoded with orjson when it is installed.
+    """
 
+    class Config:
+        json_loads = json_loads
 
-class JournalTypes(Enum):
-    DEFAULT = "default"
-    HUMBUG = "humbug"
 
+class BugoutFrozenModel(BugoutModel):
+    """
+    Read only response model. Instances could be safely shared between callers,
+    e.g. returned from cache, and are hashable unless they hold lists.
+    """
 
-class EntryRepresentationTypes(Enum):
-    ENTRY = "entry"
-    ENTITY = "entity"
+    class Config:
+        frozen = True
 
 
 class BugoutUser(BaseModel):
@@ -76,7 +63,7 @@ class BugoutUserShort(BaseModel):
     user_type: Role
 
 
-class BugoutToken(BaseModel):
+class BugoutToken(BugoutFrozenModel):
     id: uuid.UUID
     user_id: uuid.UUID
     active: bool
@@ -93,13 +80,13 @@ class BugoutUserTokens(BaseModel):
     tokens: List[BugoutToken] = Field(alias="token")
 
 
-class BugoutGroup(BaseModel):
+class BugoutGroup(BugoutFrozenModel):
     id: uuid.UUID
     group_name: Optional[str] = Field(alias="name")
     autogenerated: bool
 
 
-class BugoutGroupUser(BaseModel):
+class BugoutGroupUser(BugoutModel):
     group_id: uuid.UUID
     user_id: uuid.UUID
     user_type: str
@@ -107,24 +94,24 @@ class BugoutGroupUser(BaseModel):
     group_name: Optional[str] = None
 
 
-class BugoutUserGroups(BaseModel):
+class BugoutUserGroups(BugoutModel):
     groups: List[BugoutGroupUser]
 
 
-class BugoutGroupMembers(BaseModel):
+class BugoutGroupMembers(BugoutModel):
     id: uuid.UUID
     name: str
     users: List[BugoutUserShort]
 
 
-class BugoutApplication(BaseModel):
+class BugoutApplication(BugoutModel):
     id: uuid.UUID
     name: str
     description: Optional[str] = None
     group_id: uuid.UUID
 
 
-class BugoutApplications(BaseModel):
+class BugoutApplications(BugoutModel):
     applications: List[BugoutApplication]
 
 
@@ -167,7 +154,7 @@ class BugoutJournalPermissions(BaseModel):
     permissions: List[BugoutJournalPermission] = Field(default_factory=list)
 
 
-class BugoutScope(BaseModel):
+class BugoutScope(BugoutFrozenModel):
     api: str
     scope: str
     description: str
@@ -201,7 +188,7 @@ class BugoutJournals(BaseModel):
     journals: List[BugoutJournal]
 
 
-class BugoutJournalEntry(BaseModel):
+class BugoutJournalEntry(BugoutModel):
     id: uuid.UUID
     journal_url: Optional[str]
     content_url: Optional[str]
@@ -214,7 +201,7 @@ class BugoutJournalEntry(BaseModel):
     context_type: Optional[str]
 
 
-class BugoutJournalEntries(BaseModel):
+class BugoutJournalEntries(BugoutModel):
     entries: List[BugoutJournalEntry]
 
 
@@ -258,7 +245,7 @@ class BugoutJournalEntriesTagsRequest(BaseModel):
     entries: List[BugoutJournalEntryTagsRequest] = Field(default_factory=list)
 
 
-class BugoutSearchResult(BaseModel):
+class BugoutSearchResult(BugoutFrozenModel):
     entry_url: str
     content_url: str
     title: str
@@ -332,7 +319,7 @@ class BugoutJournalEntities(BaseModel):
     entities: List[BugoutJournalEntity] = Field(default_factory=list)
 
 
-class BugoutSearchResultAsEntity(BaseModel):
+class BugoutSearchResultAsEntity(BugoutFrozenModel):
     journal_id: str
     entity_url: str
     title: str
@@ -353,3 +340,25 @@ class BugoutSearchResults(BaseModel):
     results: List[Union[BugoutSearchResult, BugoutSearchResultAsEntity]] = Field(
         default_factory=list
     )
+
+
+def parse_search_results(
+    result: Dict[str, Any],
+    representation: EntryRepresentationTypes = EntryRepresentationTypes.ENTRY,
+) -> BugoutSearchResults:
+    """
+    Build search results from decoded response body. Results list is validated
+    at once against model of requested representation, so entries do not pass
+    through union validation of BugoutSearchResults one by one.
+    """
+    result_type = (
+        BugoutSearchResultAsEntity
+        if representation == EntryRepresentationTypes.ENTITY
+        else BugoutSearchResult
+    )
+    fields = {key: value for key, value in result.items() if key != "results"}
+    search_results = BugoutSearchResults(**fields)
+    search_results.results = parse_obj_as(
+        List[result_type], result.get("results") or []  # type: ignore
+    )
+    return search_results
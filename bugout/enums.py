@@ -0,0 +1,56 @@
+from enum import Enum, unique
+from typing import Dict
+
+
+@unique
+class Method(Enum):
+    delete = "delete"
+    get = "get"
+    post = "post"
+    put = "put"
+
+
+# Plain HTTP verbs of Method members, dict lookup is cheaper than enum .value
+METHOD_STRS: Dict[Method, str] = {method: method.value for method in Method}
+
+
+@unique
+class Role(Enum):
+    owner = "owner"
+    member = "member"
+
+
+@unique
+class TokenType(Enum):
+    bugout = "bugout"
+    slack = "slack"
+    github = "github"
+
+
+@unique
+class HolderType(Enum):
+    user = "user"
+    group = "group"
+
+
+class ResourcePermissions(Enum):
+    ADMIN = "admin"
+    CREATE = "create"
+    READ = "read"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class AuthType(Enum):
+    bearer = "Bearer"
+    web3 = "Web3"
+
+
+class JournalTypes(Enum):
+    DEFAULT = "default"
+    HUMBUG = "humbug"
+
+
+class EntryRepresentationTypes(Enum):
+    ENTRY = "entry"
+    ENTITY = "entity"
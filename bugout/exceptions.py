@@ -7,6 +7,12 @@ class InvalidUrlSpec(ValueError):
     """
 
 
+class InvalidBackendSpec(ValueError):
+    """
+    Raised when an unsupported HTTP backend is specified.
+    """
+
+
 class BugoutUnexpectedResponse(Exception):
     """
     Raised when Bugout server response is unexpected (e.g. unparseable).
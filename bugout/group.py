@@ -1,7 +1,15 @@
 import uuid
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Union
 
-from .calls import make_request
+from .calls import (
+    _DELETE,
+    _GET,
+    _POST,
+    _PUT,
+    SessionType,
+    TimeoutType,
+    make_request_raw,
+)
 from .data import (
     BugoutApplication,
     BugoutApplications,
@@ -22,70 +30,111 @@ class Group:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
+        session: Optional[SessionType] = None,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid brood url specified")
         self.url = url
+        self._base_url = url.rstrip("/")
         self.timeout = timeout
+        self.session = session
 
-    def _call(self, method: Method, path: str, **kwargs):
-        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+    def _call_raw(
+        self,
+        method: Union[str, Method],
+        url: str,
+        headers: Optional[Mapping[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[TimeoutType] = None,
+    ) -> bytes:
+        result = make_request_raw(
+            method=method,
+            url=url,
+            session=self.session,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
         return result
 
     def get_group(
-        self, token: Union[str, uuid.UUID], group_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroup:
-        get_group_path = f"group/{group_id}"
+        get_group_url = f"{self._base_url}/group/{group_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=get_group_path, headers=headers)
-        return BugoutGroup(**result)
+        raw = self._call_raw(
+            method=_GET, url=get_group_url, headers=headers, timeout=timeout
+        )
+        return BugoutGroup.parse_raw(raw)
 
     def find_group(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroup:
-        find_group_path = f"groups/find"
+        find_group_url = f"{self._base_url}/groups/find"
         query_params = {"group_id": group_id}
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get,
-            path=find_group_path,
+        raw = self._call_raw(
+            method=_GET,
+            url=find_group_url,
             params=query_params,
             headers=headers,
+            timeout=timeout,
         )
-        return BugoutGroup(**result)
+        return BugoutGroup.parse_raw(raw)
 
-    def get_user_groups(self, token: Union[str, uuid.UUID]) -> BugoutUserGroups:
-        get_user_groups_path = "groups"
+    def get_user_groups(
+        self, token: Union[str, uuid.UUID], timeout: Optional[TimeoutType] = None
+    ) -> BugoutUserGroups:
+        get_user_groups_url = f"{self._base_url}/groups"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=get_user_groups_path, headers=headers
+        raw = self._call_raw(
+            method=_GET,
+            url=get_user_groups_url,
+            headers=headers,
+            timeout=timeout,
         )
-        return BugoutUserGroups(**result)
+        return BugoutUserGroups.parse_raw(raw)
 
     def create_group(
-        self, token: Union[str, uuid.UUID], group_name: str
+        self,
+        token: Union[str, uuid.UUID],
+        group_name: str,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroup:
-        create_group_path = "group"
+        create_group_url = f"{self._base_url}/group"
         data = {
             "group_name": group_name,
         }
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=create_group_path, headers=headers, data=data
+        raw = self._call_raw(
+            method=_POST,
+            url=create_group_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
-        return BugoutGroup(**result)
+        return BugoutGroup.parse_raw(raw)
 
     def set_user_group(
         self,
@@ -94,8 +143,9 @@ class Group:
         user_type: Role,
         username: Optional[str] = None,
         email: Optional[str] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroupUser:
-        set_user_group_path = f"group/{group_id}/role"
+        set_user_group_url = f"{self._base_url}/group/{group_id}/role"
 
         if username is None and email is None:
             raise GroupInvalidParameters(
@@ -112,10 +162,14 @@ class Group:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.post, path=set_user_group_path, headers=headers, data=data
+        raw = self._call_raw(
+            method=_POST,
+            url=set_user_group_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
-        return BugoutGroupUser(**result)
+        return BugoutGroupUser.parse_raw(raw)
 
     def delete_user_group(
         self,
@@ -123,11 +177,12 @@ class Group:
         group_id: Union[str, uuid.UUID],
         username: Optional[str] = None,
         email: Optional[str] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroupUser:
         """
         TODO(kompotkot): Merge with set_user_group()
         """
-        delete_user_group_path = f"group/{group_id}/role"
+        delete_user_group_url = f"{self._base_url}/group/{group_id}/role"
 
         if username is None and email is None:
             raise GroupInvalidParameters(
@@ -142,55 +197,73 @@ class Group:
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.delete,
-            path=delete_user_group_path,
+        raw = self._call_raw(
+            method=_DELETE,
+            url=delete_user_group_url,
             headers=headers,
             data=data,
+            timeout=timeout,
         )
-        return BugoutGroupUser(**result)
+        return BugoutGroupUser.parse_raw(raw)
 
     def get_group_members(
-        self, token: Union[str, uuid.UUID], group_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroupMembers:
-        get_group_members_path = f"group/{group_id}/users"
+        get_group_members_url = f"{self._base_url}/group/{group_id}/users"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.get, path=get_group_members_path, headers=headers
+        raw = self._call_raw(
+            method=_GET,
+            url=get_group_members_url,
+            headers=headers,
+            timeout=timeout,
         )
-        return BugoutGroupMembers(**result)
+        return BugoutGroupMembers.parse_raw(raw)
 
     def update_group(
         self,
         token: Union[str, uuid.UUID],
         group_id: Union[str, uuid.UUID],
         group_name: str,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroup:
-        update_group_path = f"group/{group_id}/name"
+        update_group_url = f"{self._base_url}/group/{group_id}/name"
         data = {
             "group_name": group_name,
         }
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.put, path=update_group_path, headers=headers, data=data
+        raw = self._call_raw(
+            method=_PUT,
+            url=update_group_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
-        return BugoutGroup(**result)
+        return BugoutGroup.parse_raw(raw)
 
     def delete_group(
-        self, token: Union[str, uuid.UUID], group_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        group_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutGroup:
-        delete_group_path = f"group/{group_id}"
+        delete_group_url = f"{self._base_url}/group/{group_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.delete, path=delete_group_path, headers=headers
+        raw = self._call_raw(
+            method=_DELETE,
+            url=delete_group_url,
+            headers=headers,
+            timeout=timeout,
         )
-        return BugoutGroup(**result)
+        return BugoutGroup.parse_raw(raw)
 
     def create_application(
         self,
@@ -198,8 +271,9 @@ class Group:
         name: str,
         description: str,
         group_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutApplication:
-        applications_path = "applications"
+        applications_url = f"{self._base_url}/applications"
         headers = {
             "Authorization": f"Bearer {token}",
         }
@@ -208,53 +282,66 @@ class Group:
             "description": description,
             "group_id": group_id,
         }
-        result = self._call(
-            method=Method.post, path=applications_path, headers=headers, data=data
+        raw = self._call_raw(
+            method=_POST,
+            url=applications_url,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
-        return BugoutApplication(**result)
+        return BugoutApplication.parse_raw(raw)
 
     def get_application(
         self,
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutApplication:
-        applications_path = f"applications/{application_id}"
+        applications_url = f"{self._base_url}/applications/{application_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=applications_path, headers=headers)
-        return BugoutApplication(**result)
+        raw = self._call_raw(
+            method=_GET, url=applications_url, headers=headers, timeout=timeout
+        )
+        return BugoutApplication.parse_raw(raw)
 
     def list_applications(
         self,
         token: Union[str, uuid.UUID],
         group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutApplications:
-        applications_path = "applications"
+        applications_url = f"{self._base_url}/applications"
         headers = {
             "Authorization": f"Bearer {token}",
         }
         query_params = {
             "group_id": group_id,
         }
-        result = self._call(
-            method=Method.get,
-            path=applications_path,
+        raw = self._call_raw(
+            method=_GET,
+            url=applications_url,
             params=query_params,
             headers=headers,
+            timeout=timeout,
         )
-        return BugoutApplications(**result)
+        return BugoutApplications.parse_raw(raw)
 
     def delete_application(
         self,
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutApplication:
-        applications_path = f"applications/{application_id}"
+        applications_url = f"{self._base_url}/applications/{application_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(
-            method=Method.delete, path=applications_path, headers=headers
+        raw = self._call_raw(
+            method=_DELETE,
+            url=applications_url,
+            headers=headers,
+            timeout=timeout,
         )
-        return BugoutApplication(**result)
+        return BugoutApplication.parse_raw(raw)
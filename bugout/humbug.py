@@ -1,7 +1,7 @@
 import uuid
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
-from .calls import make_request
+from .calls import SessionType, TimeoutType, make_request
 from .data import BugoutHumbugIntegrationsList, Method
 from .exceptions import InvalidUrlSpec
 from .settings import REQUESTS_TIMEOUT
@@ -13,22 +13,46 @@ class Humbug:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
+        session: Optional[SessionType] = None,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid spire url specified")
         self.url = url
+        self._base_url = url.rstrip("/")
         self.timeout = timeout
+        self.session = session
 
-    def _call(self, method: Method, path: str, **kwargs):
-        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+    def _call(
+        self,
+        method: Union[str, Method],
+        path: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[TimeoutType] = None,
+    ):
+        url = f"{self._base_url}/{path.rstrip('/')}"
+        result = make_request(
+            method=method,
+            url=url,
+            session=self.session,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
         return result
 
     def get_humbug_integrations(
         self,
         token: Union[str, uuid.UUID],
         group_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutHumbugIntegrationsList:
         humbug_path = "humbug/integrations"
         headers = {
@@ -38,6 +62,10 @@ class Humbug:
         if group_id is not None:
             query_params.update({"group_id": group_id})
         result = self._call(
-            method=Method.get, path=humbug_path, params=query_params, headers=headers
+            method=Method.get,
+            path=humbug_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
         )
         return BugoutHumbugIntegrationsList(**result)
@@ -3,29 +3,53 @@ This module makes it easy to use a Bugout journal as a job queue. It is inspired
 integration: https://github.com/bugout-dev/thorax
 """
 
-import argparse
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from enum import Enum
-import json
-import os
-import requests  # type: ignore
-from typing import Callable, Optional, List
+from functools import lru_cache
+from itertools import islice
+import sys
+import time
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    List,
+    NoReturn,
+    Tuple,
+    Union,
+)
 
-from .app import Bugout
+from .app import Bugout, _auth
+from .calls import SessionType, TimeoutType, json_dumps, json_loads, make_request
 from .data import (
     AuthType,
+    BugoutSearchResultAsEntity,
     BugoutSearchResultWithEntryID,
     BugoutSearchResult,
-    BugoutSearchResult,
+    BugoutSearchResults,
 )
 from .journal import SearchOrder
 from .settings import BUGOUT_BROOD_URL, BUGOUT_SPIRE_URL, REQUESTS_TIMEOUT
 
+if TYPE_CHECKING:
+    # Only the CLI needs argparse, it is imported in generate_cli
+    import argparse
+
 
 DEFAULT_CONTEXT_TYPE = "job"
 DEFAULT_SUCCESS_TAG = "job:success"
 DEFAULT_FAILURE_TAG = "job:failure"
 DEFAULT_CURSOR_CONTEXT_TYPE = "job_cursor"
+# Number of jobs marked with one bulk tags request
+DEFAULT_TAGS_BATCH_SIZE = 100
 
 
 class JobView(Enum):
@@ -34,6 +58,61 @@ class JobView(Enum):
     FAILURE = "failure"
 
 
+def view_query_components(
+    job_view: JobView, context_type: str, success_tag: str, failure_tag: str
+) -> List[str]:
+    """
+    Search query components selecting jobs of the given job view.
+    """
+    query_components: List[str] = [
+        f"context_type:{context_type}",
+    ]
+    if job_view == JobView.REMAINING:
+        query_components.extend(
+            [
+                f"!tag:{success_tag}",
+                f"!tag:{failure_tag}",
+            ]
+        )
+    elif job_view == JobView.SUCCESS:
+        query_components.append(
+            f"tag:{success_tag}",
+        )
+    elif job_view == JobView.FAILURE:
+        query_components.append(
+            f"tag:{failure_tag}",
+        )
+    return query_components
+
+
+def iso_created_at(created_at: str) -> str:
+    """
+    Return created_at of a journal entry in ISO format accepted by search queries. Spire returns
+    it with a space between date and time, which is always at position 10.
+    """
+    if len(created_at) > 10 and created_at[10] == " ":
+        return f"{created_at[:10]}T{created_at[11:]}"
+    return created_at
+
+
+def job_from_result(
+    raw_result: Union[BugoutSearchResult, BugoutSearchResultAsEntity]
+) -> BugoutSearchResultWithEntryID:
+    """
+    Convert search result into job, id of the job is the id of its journal entry.
+
+    Fields of search results are validated when the response is parsed, so jobs are constructed
+    from them without validating the same values again.
+    """
+    if isinstance(raw_result, BugoutSearchResult):
+        return BugoutSearchResultWithEntryID.construct(
+            **raw_result.__dict__, id=raw_result.entry_url.rpartition("/")[2]
+        )
+    return BugoutSearchResultWithEntryID(
+        **dict(raw_result), id=raw_result.entity_url.rpartition("/")[2]
+    )
+
+
 class BugoutJobQueue:
     """
     This class implements a job queue in a Bugout journal.
@@ -61,16 +140,68 @@ class BugoutJobQueue:
         spire_api_url: str = BUGOUT_SPIRE_URL,
         write_timeout: float = REQUESTS_TIMEOUT,
         auth_type: str = AuthType.bearer.name,
+        session: Optional[SessionType] = None,
+        cursor_ttl: float = 30.0,
+        client: Optional[Bugout] = None,
+        connect_timeout: float = 3.0,
+        backend: str = "requests",
     ) -> None:
+        """
+        session: session to use for all queue calls, by default queue shares module level pooled
+        session from bugout.calls.shared_session, passed session is not closed on close()
+        cursor_ttl: seconds to reuse position of the most recent cursor between list_jobs calls
+        client: existing Bugout client to make calls with, its session is used and kept open on
+        close(), brood_api_url, spire_api_url and session are ignored in this case
+        connect_timeout: seconds to wait for connection in write calls, write_timeout is then
+        applied to reading the response
+        backend: "requests" (default) or "httpx" to multiplex queue calls over one HTTP/2
+        connection per host, see Bugout for details
+        """
         self.bugout_token = bugout_token
         self.journal_id = journal_id
         self.context_type = context_type
         self.success_tag = success_tag
         self.failure_tag = failure_tag
         self.cursor_context_type = cursor_context_type
-        self.client = Bugout(brood_api_url, spire_api_url)
+        # Search queries of job views are fixed by the queue parameters
+        self._base_query_by_view = {
+            view: " ".join(
+                view_query_components(view, context_type, success_tag, failure_tag)
+            )
+            for view in JobView
+        }
+        # Cursor updates and journal calls reuse keep-alive connections of one session
+        self._owns_client = client is None
+        self.client = (
+            client
+            if client is not None
+            else Bugout(brood_api_url, spire_api_url, backend=backend, session=session)
+        )
+        self._session: SessionType = self.client.session
         self.write_timeout = write_timeout
+        self.connect_timeout = connect_timeout
+        self._write_timeouts: TimeoutType = (connect_timeout, write_timeout)
         self.auth_type = auth_type
+        self._entries_url = f'{self.client.spire_api_url.rstrip("/")}/journals/{self.journal_id}/entries'
+        self._cursor_tag = f"cursor:{cursor_context_type}"
+        self._cursor_query = f"context_type:{cursor_context_type}"
+        self._cursor_headers = {
+            "Authorization": f"{_auth(auth_type).value} {bugout_token}"
+        }
+
+        # Monotonic time of lookup and created_at of the most recent cursor
+        self.cursor_ttl = cursor_ttl
+        self._cursor_cache: Optional[Tuple[float, Optional[str]]] = None
+
+    def close(self) -> None:
+        if self._owns_client:
+            self.client.close()
+
+    def __enter__(self) -> "BugoutJobQueue":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
     def create_job(self, context_id: str, job_title: str, job_content: str) -> None:
         """
@@ -84,32 +215,77 @@ class BugoutJobQueue:
             tags=[self.context_type, f"{self.context_type}:{context_id}"],
             context_id=context_id,
             context_type=self.context_type,
-            timeout=self.write_timeout,
+            timeout=self._write_timeouts,
         )
 
+    def create_jobs(
+        self, specs: Iterable[Tuple[str, str, str]], workers: int = 8
+    ) -> None:
+        """
+        Create jobs from (context_id, job_title, job_content) specs. Up to workers jobs are created
+        concurrently over keep-alive connections of the queue session.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume results to raise the first failure
+            list(executor.map(lambda spec: self.create_job(*spec), specs))
+
     def update_cursor(self, created_at: datetime):
         """
         Update the position of the cursor in the journal to the given "created_at" time.
 
         This is done by simply creating a new entry representing the cursor position.
         """
-        cursor_tag = f"cursor:{self.cursor_context_type}"
-        headers = {"Authorization": f"{self.auth_type} {self.bugout_token}"}
         body = {
-            "title": cursor_tag,
+            "title": self._cursor_tag,
             "content": "",
-            "tags": [cursor_tag],
+            "tags": [self._cursor_tag],
             "context_type": self.cursor_context_type,
             "created_at": created_at.isoformat(),
         }
-        request_url = f'{self.client.spire_api_url.rstrip("/")}/journals/{self.journal_id}/entries'
-        r = requests.post(
-            request_url,
-            headers=headers,
+        make_request(
+            "post",
+            self._entries_url,
+            session=self._session,
+            headers=self._cursor_headers,
             json=body,
-            timeout=self.write_timeout,
+            timeout=self._write_timeouts,
         )
-        r.raise_for_status()
+        # The most recent cursor could be newer than the written one, it is looked up again
+        self.invalidate_cursor()
+
+    def invalidate_cursor(self) -> None:
+        """
+        Drop cached cursor position, e.g. after another worker moved the cursor. The next listing
+        with use_cursor searches for the cursor again.
+        """
+        self._cursor_cache = None
+
+    def _get_cursor_created_at(self) -> Optional[str]:
+        """
+        Return creation time of the most recent cursor or None if there is no cursor yet.
+
+        The position is cached for cursor_ttl seconds, so paging through jobs does not search for
+        the cursor on every page.
+        """
+        if self._cursor_cache is not None:
+            cached_at, created_at = self._cursor_cache
+            if time.monotonic() - cached_at < self.cursor_ttl:
+                return created_at
+
+        cursor_results = self.client.search(
+            self.bugout_token,
+            self.journal_id,
+            self._cursor_query,
+            limit=1,
+            content=False,
+            order=SearchOrder.DESCENDING,
+            auth_type=self.auth_type,
+        )
+        created_at = None
+        if cursor_results.results:
+            created_at = iso_created_at(cursor_results.results[0].created_at)
+        self._cursor_cache = (time.monotonic(), created_at)
+        return created_at
 
     def list_jobs(
         self,
@@ -117,6 +293,7 @@ class BugoutJobQueue:
         use_cursor: bool = True,
         limit: int = 10,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[BugoutSearchResultWithEntryID]:
         """
         List all jobs from the given job view:
@@ -124,50 +301,106 @@ class BugoutJobQueue:
         - SUCCESS: These are jobs that have been marked as successfully completed.
         - FAILURE: These are jobs that have meen marked as failures.
 
-        If the use_cursor argument is True, this only returns jobs since the most recent cursor. If it is
-        False, returns all jobs from the given job view since the beginning of time.
+        If the use_cursor argument is True, this only returns jobs since the most recent cursor (or all
+        jobs if there is no cursor yet). If it is False, returns all jobs from the given job view since the
+        beginning of time.
 
-        Use the limit and offset parameters to page through the jobs.
+        Use the limit and after parameters to page through the jobs: pass created_at of the last job
+        from the previous page as after to get jobs created after it. Unlike offset, which is still
+        supported, the server does not have to skip over previous pages to find the next one.
 
         Jobs are returned in chronological order.
         """
-        query_components: List[str] = [
-            f"context_type:{self.context_type}",
-        ]
-        if job_view == JobView.REMAINING:
-            query_components.extend(
-                [
-                    f"!tag:{self.success_tag}",
-                    f"!tag:{self.failure_tag}",
-                ]
-            )
-        elif job_view == JobView.SUCCESS:
-            query_components.append(
-                f"tag:{self.success_tag}",
-            )
-        elif job_view == JobView.FAILURE:
-            query_components.append(
-                f"tag:{self.failure_tag}",
+        return list(
+            self.iter_jobs(
+                job_view=job_view,
+                use_cursor=use_cursor,
+                limit=limit,
+                offset=offset,
+                after=after,
             )
+        )
+
+    def iter_jobs(
+        self,
+        job_view: JobView = JobView.REMAINING,
+        use_cursor: bool = True,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Iterator[BugoutSearchResultWithEntryID]:
+        """
+        Same as list_jobs, but yields jobs one by one instead of building the whole list. Jobs are
+        requested when iteration starts.
+        """
+        query = self._jobs_query(job_view, use_cursor, after)
+        job_results = self._search_jobs(query, limit, offset)
+
+        for raw_result in job_results.results:
+            yield job_from_result(raw_result)
+
+    def iter_all_jobs(
+        self,
+        job_view: JobView = JobView.REMAINING,
+        use_cursor: bool = True,
+        page_size: int = 100,
+        workers: int = 8,
+    ) -> Iterator[BugoutSearchResultWithEntryID]:
+        """
+        Yields all jobs from the given job view in chronological order. The first page tells how many
+        jobs there are, the rest of pages are requested concurrently and yielded in order. At most
+        workers pages are requested or buffered ahead of the consumer, the next page is requested
+        as each page is yielded. Pages which were not requested yet are dropped if iteration stops
+        early.
+
+        Pages are taken by offset from the same query, so jobs marked while iterating over a
+        REMAINING view could shift pages and be skipped.
+        """
+        query = self._jobs_query(job_view, use_cursor, None)
+        first_page = self._search_jobs(query, page_size, 0)
+        for raw_result in first_page.results:
+            yield job_from_result(raw_result)
+
+        offsets = iter(range(page_size, first_page.total_results, page_size))
+        if not first_page.results:
+            return
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending: Deque["Future[BugoutSearchResults]"] = deque()
+        try:
+            for offset in islice(offsets, workers):
+                pending.append(
+                    executor.submit(self._search_jobs, query, page_size, offset)
+                )
+            while pending:
+                page = pending.popleft().result()
+                for offset in islice(offsets, 1):
+                    pending.append(
+                        executor.submit(self._search_jobs, query, page_size, offset)
+                    )
+                for raw_result in page.results:
+                    yield job_from_result(raw_result)
+        finally:
+            # Window holds all submitted pages, so cancelling it drops every queued request
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _jobs_query(
+        self, job_view: JobView, use_cursor: bool, after: Optional[str]
+    ) -> str:
+        query = self._base_query_by_view[job_view]
 
         if use_cursor:
-            cursor_results = self.client.search(
-                self.bugout_token,
-                self.journal_id,
-                f"context_type:{self.cursor_context_type}",
-                limit=1,
-                content=False,
-                order=SearchOrder.DESCENDING,
-                auth_type=self.auth_type,
-            )
-            if cursor_results.results:
-                cursor = cursor_results.results[0]
+            created_at = self._get_cursor_created_at()
+            if created_at is not None:
+                query = f"{query} created_at:>{created_at}"
 
-            created_at = cursor.created_at.replace(" ", "T")
-            query_components.append(f"created_at:>{created_at}")
+        if after is not None:
+            query = f"{query} created_at:>{iso_created_at(after)}"
+        return query
 
-        query = " ".join(query_components)
-        job_results = self.client.search(
+    def _search_jobs(self, query: str, limit: int, offset: int) -> BugoutSearchResults:
+        return self.client.search(
             self.bugout_token,
             self.journal_id,
             query,
@@ -178,19 +411,6 @@ class BugoutJobQueue:
             auth_type=self.auth_type,
         )
 
-        results = [
-            BugoutSearchResultWithEntryID(
-                **dict(raw_result),
-                id=(
-                    raw_result.entry_url.split("/")[-1]
-                    if isinstance(raw_result, BugoutSearchResult)
-                    else raw_result.entity_url.split("/")[-1]
-                ),
-            )
-            for raw_result in job_results.results
-        ]
-        return results
-
     def job_complete(self, job_id: str) -> None:
         """
         Mark a job as successfully completed.
@@ -200,7 +420,7 @@ class BugoutJobQueue:
             self.journal_id,
             job_id,
             tags=[self.success_tag],
-            timeout=self.write_timeout,
+            timeout=self._write_timeouts,
             auth_type=self.auth_type,
         )
 
@@ -213,19 +433,78 @@ class BugoutJobQueue:
             self.journal_id,
             job_id,
             tags=[self.failure_tag],
-            timeout=self.write_timeout,
+            timeout=self._write_timeouts,
             auth_type=self.auth_type,
         )
 
+    def jobs_complete(
+        self,
+        job_ids: Iterable[str],
+        workers: int = 8,
+        batch_size: int = DEFAULT_TAGS_BATCH_SIZE,
+    ) -> None:
+        """
+        Mark jobs as successfully completed. Tags are added with one bulk request per batch_size
+        jobs, up to workers batches are sent at once.
+        """
+        self._tag_jobs(self.success_tag, job_ids, workers, batch_size)
+
+    def jobs_failed(
+        self,
+        job_ids: Iterable[str],
+        workers: int = 8,
+        batch_size: int = DEFAULT_TAGS_BATCH_SIZE,
+    ) -> None:
+        """
+        Mark jobs as failed. Tags are added with one bulk request per batch_size jobs, up to
+        workers batches are sent at once.
+        """
+        self._tag_jobs(self.failure_tag, job_ids, workers, batch_size)
+
+    def _tag_jobs(
+        self, tag: str, job_ids: Iterable[str], workers: int, batch_size: int
+    ) -> None:
+        """
+        Concurrent requests share keep-alive connection pool of the queue session.
+        """
+        job_ids = list(job_ids)
+        batches = [
+            job_ids[i : i + batch_size] for i in range(0, len(job_ids), batch_size)
+        ]
+
+        def tag_batch(batch: List[str]) -> None:
+            self.client.create_entries_tags(
+                self.bugout_token,
+                self.journal_id,
+                [{"entry_id": job_id, "tags": [tag]} for job_id in batch],
+                timeout=self._write_timeouts,
+                auth_type=self.auth_type,
+            )
+
+        if workers <= 1 or len(batches) <= 1:
+            for batch in batches:
+                tag_batch(batch)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume results to raise the first failure
+            list(executor.map(tag_batch, batches))
+
+
+def _resolve_env_arg(raw: Optional[str], environment_variable: str) -> Optional[str]:
+    """
+    Return the given command line value, or the value of the environment variable if it was not
+    provided.
+    """
+    import os
+
+    return raw or os.environ.get(environment_variable) or None
+
 
 def value_or_environment_variable(
     environment_variable: str, error_if_none: bool
 ) -> Callable[[Optional[str]], Optional[str]]:
     def type_fn(raw: Optional[str]) -> Optional[str]:
-        final = raw
-        if not raw:
-            final = os.environ.get(environment_variable)
-
+        final = _resolve_env_arg(raw, environment_variable)
         if not final and error_if_none:
             raise ValueError(f"{environment_variable} not set")
 
@@ -234,17 +513,18 @@ def value_or_environment_variable(
     return type_fn
 
 
-def add_queue_args(parser: argparse.ArgumentParser) -> None:
+def add_queue_args(parser: "argparse.ArgumentParser") -> None:
     """
     Mutates the given argument parser by adding common arguments needed to instantiate a job queue for
     all commands in the jobs CLI.
     """
+    # Token and journal are resolved after parsing, missing values are reported by this parser
+    parser.set_defaults(_queue_parser=parser)
     parser.add_argument(
         "-t",
         "--token",
         required=False,
         default="",
-        type=value_or_environment_variable("BUGOUT_JOBS_ACCESS_TOKEN", True),
         help="An access token for the Bugout API. If this is not provided, the BUGOUT_JOBS_ACCESS_TOKEN environment variable is used.",
     )
     parser.add_argument(
@@ -252,7 +532,6 @@ def add_queue_args(parser: argparse.ArgumentParser) -> None:
         "--journal",
         required=False,
         default="",
-        type=value_or_environment_variable("BUGOUT_JOBS_JOURNAL_ID", True),
         help="An access token for the Bugout API. If this is not provided, the BUGOUT_JOBS_JOURNAL_ID environment variable is used.",
     )
     parser.add_argument(
@@ -298,6 +577,13 @@ def add_queue_args(parser: argparse.ArgumentParser) -> None:
         default=30.0,
         help="Timeout for writing jobs and cursors to the job journal.",
     )
+    parser.add_argument(
+        "--connect-timeout",
+        required=False,
+        type=float,
+        default=3.0,
+        help="Timeout for connecting to the API when writing jobs and cursors, --write-timeout is applied to reading responses.",
+    )
     parser.add_argument(
         "--auth-type",
         required=False,
@@ -306,12 +592,83 @@ def add_queue_args(parser: argparse.ArgumentParser) -> None:
         choices=[AuthType.bearer.name, AuthType.web3.name],
         help="Type of token that you are using to authenticate to the job journal.",
     )
+    parser.add_argument(
+        "--backend",
+        required=False,
+        default="requests",
+        choices=["requests", "httpx"],
+        help='HTTP client for API calls, "httpx" multiplexes them over HTTP/2 and requires: pip install "bugout[httpx]"',
+    )
+
+
+def add_job_ids_args(parser: "argparse.ArgumentParser", mark: str) -> None:
+    """
+    Mutates the given argument parser by adding arguments to select jobs to mark.
+    """
+    parser.add_argument(
+        "-i",
+        "--job-id",
+        action="append",
+        default=[],
+        help=f"ID of job to mark as {mark}. Could be repeated to mark several jobs.",
+    )
+    parser.add_argument(
+        "--job-ids-file",
+        required=False,
+        default=None,
+        help=f"File with IDs of jobs to mark as {mark}, one per line.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of batches of jobs to mark concurrently.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_TAGS_BATCH_SIZE,
+        help="Number of jobs to mark with one request.",
+    )
 
 
-def queue_from_args(args: argparse.Namespace) -> BugoutJobQueue:
+@lru_cache(maxsize=4)
+def _make_bugout(brood_api_url: str, spire_api_url: str, backend: str) -> Bugout:
+    """
+    Bugout client shared by queues of CLI commands run in one process, so its keep-alive
+    connections are reused between commands.
+    """
+    return Bugout(brood_api_url, spire_api_url, backend=backend)
+
+
+def _usage_error(args: "argparse.Namespace", message: str) -> NoReturn:
+    """
+    Report invalid command line arguments found after parsing by the parser of the command, or
+    raise ValueError for namespaces which were not produced by the jobs CLI.
+    """
+    parser: Optional["argparse.ArgumentParser"] = getattr(args, "_queue_parser", None)
+    if parser is None:
+        raise ValueError(message)
+    # Exits with usage and status 2, the same as argparse does for invalid arguments
+    parser.error(message)
+
+
+def _required_env_arg(
+    args: "argparse.Namespace", raw: Optional[str], environment_variable: str, flag: str
+) -> str:
+    final = _resolve_env_arg(raw, environment_variable)
+    if final is None:
+        _usage_error(
+            args,
+            f"{environment_variable} not set, pass {flag} or set the environment variable",
+        )
+    return final
+
+
+def queue_from_args(args: "argparse.Namespace") -> BugoutJobQueue:
     return BugoutJobQueue(
-        args.token,
-        args.journal,
+        _required_env_arg(args, args.token, "BUGOUT_JOBS_ACCESS_TOKEN", "--token"),
+        _required_env_arg(args, args.journal, "BUGOUT_JOBS_JOURNAL_ID", "--journal"),
         args.context_type,
         args.success_tag,
         args.failure_tag,
@@ -320,45 +677,175 @@ def queue_from_args(args: argparse.Namespace) -> BugoutJobQueue:
         args.spire_api_url,
         args.write_timeout,
         args.auth_type,
+        client=_make_bugout(args.brood_api_url, args.spire_api_url, args.backend),
+        connect_timeout=args.connect_timeout,
     )
 
 
-def handle_create_job(args: argparse.Namespace) -> None:
-    queue = queue_from_args(args)
-    queue.create_job(args.context_id, args.title, args.content)
-
-
-def handle_list_jobs(args: argparse.Namespace) -> None:
-    queue = queue_from_args(args)
-    jobs = queue.list_jobs(args.view, args.use_cursor, args.limit, args.offset)
-    print(json.dumps([json.loads(job.json()) for job in jobs]))
-
-
-def handle_complete_job(args: argparse.Namespace) -> None:
-    queue = queue_from_args(args)
-    queue.job_complete(args.job_id)
-
+def handle_create_job(args: "argparse.Namespace") -> None:
+    with queue_from_args(args) as queue:
+        queue.create_job(args.context_id, args.title, args.content)
 
-def handle_fail_job(args: argparse.Namespace) -> None:
-    queue = queue_from_args(args)
-    queue.job_failed(args.job_id)
 
+def handle_create_jobs(args: "argparse.Namespace") -> None:
+    specs: List[Tuple[str, str, str]] = []
+    with open(args.jobs_file) as ifp:
+        for line in ifp:
+            if not line.strip():
+                continue
+            job = json_loads(line)
+            specs.append((job.get("context_id", ""), job["title"], job["content"]))
+    with queue_from_args(args) as queue:
+        queue.create_jobs(specs, args.workers)
 
-def handle_update_cursor(args: argparse.Namespace) -> None:
-    queue = queue_from_args(args)
-    if args.time is None:
-        args.time = datetime.utcnow()
-    queue.update_cursor(created_at=args.time)
 
-
-def generate_cli() -> argparse.ArgumentParser:
+def handle_list_jobs(args: "argparse.Namespace") -> None:
+    with queue_from_args(args) as queue:
+        if args.all:
+            jobs = queue.iter_all_jobs(
+                args.view, args.use_cursor, page_size=args.page_size
+            )
+        else:
+            jobs = queue.iter_jobs(
+                args.view, args.use_cursor, args.limit, args.offset, args.after
+            )
+        # Jobs are written one by one as they are converted, job fields are JSON native types, so
+        # they are serialized once without .json() round trip
+        out = sys.stdout.buffer
+        if args.ndjson:
+            for job in jobs:
+                out.write(json_dumps(job.dict()))
+                out.write(b"\n")
+            return
+        separator = b"["
+        for job in jobs:
+            out.write(separator)
+            out.write(json_dumps(job.dict()))
+            separator = b","
+        out.write(b"[]\n" if separator == b"[" else b"]\n")
+
+
+def job_ids_from_args(args: "argparse.Namespace") -> List[str]:
+    job_ids: List[str] = list(args.job_id or [])
+    if args.job_ids_file is not None:
+        with open(args.job_ids_file) as ifp:
+            job_ids.extend(line.strip() for line in ifp if line.strip())
+    if not job_ids:
+        _usage_error(args, "No job IDs provided, use -i/--job-id or --job-ids-file")
+    # Job IDs are journal entry IDs, bulk tags requests accept only UUIDs
+    invalid_ids = []
+    for job_id in job_ids:
+        try:
+            uuid.UUID(job_id)
+        except ValueError:
+            invalid_ids.append(job_id)
+    if invalid_ids:
+        _usage_error(args, f"Invalid job IDs: {', '.join(invalid_ids)}")
+    return job_ids
+
+
+def handle_complete_job(args: "argparse.Namespace") -> None:
+    job_ids = job_ids_from_args(args)
+    with queue_from_args(args) as queue:
+        if len(job_ids) == 1:
+            queue.job_complete(job_ids[0])
+        else:
+            queue.jobs_complete(job_ids, args.workers, args.batch_size)
+
+
+def handle_fail_job(args: "argparse.Namespace") -> None:
+    job_ids = job_ids_from_args(args)
+    with queue_from_args(args) as queue:
+        if len(job_ids) == 1:
+            queue.job_failed(job_ids[0])
+        else:
+            queue.jobs_failed(job_ids, args.workers, args.batch_size)
+
+
+def handle_update_cursor(args: "argparse.Namespace") -> None:
+    with queue_from_args(args) as queue:
+        if args.time is None:
+            args.time = datetime.now(timezone.utc)
+        queue.update_cursor(created_at=args.time)
+
+
+def run_command(argv: List[str]) -> Dict[str, Any]:
+    """
+    Run jobs CLI command given as list of arguments in this process and return its result as
+    {"ok": ..., "output": ...} on success or {"ok": false, "error": ...} on failure. Output is the
+    text the command writes to stdout.
+    """
+    import contextlib
+    import io
+
+    buffer = io.BytesIO()
+    output = io.TextIOWrapper(buffer, encoding="utf-8", write_through=True)
+    errors = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+            args = get_cli().parse_args(argv)
+            if args.func is handle_serve:
+                raise ValueError("serve command could not be run by server")
+            args.func(args)
+    except SystemExit:
+        # argparse exits on invalid arguments and --help
+        if errors.getvalue():
+            return {"ok": False, "error": errors.getvalue().strip()}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, "output": buffer.getvalue().decode("utf-8")}
+
+
+def handle_serve(args: "argparse.Namespace") -> None:
+    """
+    Serve jobs CLI commands over Unix socket. Each line sent to the socket is JSON array of command
+    arguments, e.g. ["create-job", "--title", "...", "--content", "..."], the server replies with
+    one JSON line from run_command. Clients and their keep-alive connections are shared by all
+    commands, so drivers submitting many jobs do not pay for interpreter startup, imports and TLS
+    handshakes per job. Commands are run one at a time.
+    """
+    import os
+    import socketserver
+
+    class CommandHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    argv = json_loads(line)
+                    if not isinstance(argv, list):
+                        raise ValueError("Command must be JSON array of arguments")
+                    result = run_command([str(arg) for arg in argv])
+                except ValueError as e:
+                    result = {"ok": False, "error": str(e)}
+                self.wfile.write(json_dumps(result) + b"\n")
+                self.wfile.flush()
+
+    with socketserver.UnixStreamServer(args.socket, CommandHandler) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(args.socket)
+
+
+def _print_help(args: "argparse.Namespace") -> None:
+    args._help_parser.print_help()
+
+
+def generate_cli(prog: Optional[str] = None) -> "argparse.ArgumentParser":
     """
     Generates the "bugout-py jobs" CLI.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
-        description="bugout-py jobs: A command-line tool to manage jobs using a Bugout journal"
+        prog=prog,
+        description="bugout-py jobs: A command-line tool to manage jobs using a Bugout journal",
     )
-    parser.set_defaults(func=lambda _: parser.print_help())
+    parser.set_defaults(func=_print_help, _help_parser=parser)
 
     subparsers = parser.add_subparsers()
 
@@ -380,6 +867,23 @@ def generate_cli() -> argparse.ArgumentParser:
     )
     create_job_parser.set_defaults(func=handle_create_job)
 
+    create_jobs_parser = subparsers.add_parser(
+        "create-jobs", help="Create jobs from JSON lines file"
+    )
+    add_queue_args(create_jobs_parser)
+    create_jobs_parser.add_argument(
+        "--jobs-file",
+        required=True,
+        help='File with one job per line as JSON object with "title", "content" and optional "context_id" keys.',
+    )
+    create_jobs_parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of jobs to create concurrently.",
+    )
+    create_jobs_parser.set_defaults(func=handle_create_jobs)
+
     list_jobs_parser = subparsers.add_parser(
         "list-jobs", help="View jobs in queue (FIFO order)"
     )
@@ -407,22 +911,40 @@ def generate_cli() -> argparse.ArgumentParser:
         default=0,
         help="Offset from which to page through list jobs",
     )
+    list_jobs_parser.add_argument(
+        "--after",
+        required=False,
+        default=None,
+        help="Only list jobs created after this time, pass created_at of the last job from the previous page to get the next one",
+    )
+    list_jobs_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="List all jobs from the view, pages of --page-size jobs are requested concurrently. --limit, --offset and --after are ignored.",
+    )
+    list_jobs_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=100,
+        help="Number of jobs per request with --all.",
+    )
+    list_jobs_parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write one job per line as it arrives instead of JSON array.",
+    )
     list_jobs_parser.set_defaults(func=handle_list_jobs)
 
     complete_job_parser = subparsers.add_parser(
         "complete-job", help="Mark a job as complete"
     )
     add_queue_args(complete_job_parser)
-    complete_job_parser.add_argument(
-        "-i", "--job-id", required=True, help="ID of job to mark as complete."
-    )
+    add_job_ids_args(complete_job_parser, "complete")
     complete_job_parser.set_defaults(func=handle_complete_job)
 
     fail_job_parser = subparsers.add_parser("fail-job", help="Mark a job as failed")
     add_queue_args(fail_job_parser)
-    fail_job_parser.add_argument(
-        "-i", "--job-id", required=True, help="ID of job to mark as failed."
-    )
+    add_job_ids_args(fail_job_parser, "failed")
     fail_job_parser.set_defaults(func=handle_fail_job)
 
     update_cursor_parser = subparsers.add_parser(
@@ -438,11 +960,31 @@ def generate_cli() -> argparse.ArgumentParser:
     )
     update_cursor_parser.set_defaults(func=handle_update_cursor)
 
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run commands sent as JSON lines over Unix socket in one process",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        required=True,
+        help="Path of Unix socket to listen on.",
+    )
+    serve_parser.set_defaults(func=handle_serve)
+
     return parser
 
 
+@lru_cache(maxsize=2)
+def get_cli(prog: Optional[str] = None) -> "argparse.ArgumentParser":
+    """
+    Returns the "bugout-py jobs" CLI, it is generated once per prog and reused by subsequent calls
+    in the same process. Parsing arguments does not change the parser, so it is safe to share.
+    """
+    return generate_cli(prog)
+
+
 def main() -> None:
-    parser = generate_cli()
+    parser = get_cli()
     args = parser.parse_args()
     args.func(args)
 
@@ -1,9 +1,15 @@
 import json
 import uuid
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from .calls import make_request
+from .calls import (
+    SessionType,
+    TimeoutType,
+    make_request,
+    make_request_raw,
+    make_request_stream,
+)
 from .data import (
     AuthType,
     BugoutJournal,
@@ -25,6 +31,7 @@ from .data import (
     HolderType,
     JournalTypes,
     Method,
+    parse_search_results,
 )
 from .exceptions import InvalidUrlSpec
 from .settings import REQUESTS_TIMEOUT
@@ -56,20 +63,71 @@ class Journal:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
+        session: Optional[SessionType] = None,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid spire url specified")
         self.url = url
+        self._base_url = url.rstrip("/")
         self.timeout = timeout
+        self.session = session
 
-    def _call(self, method: Method, path: str, **kwargs):
-        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+    def _call(
+        self,
+        method: Union[str, Method],
+        path: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[TimeoutType] = None,
+    ):
+        url = f"{self._base_url}/{path}"
+        result = make_request(
+            method=method,
+            url=url,
+            session=self.session,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        return result
+
+    def _call_raw(
+        self,
+        method: Union[str, Method],
+        path: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[TimeoutType] = None,
+    ) -> bytes:
+        url = f"{self._base_url}/{path}"
+        result = make_request_raw(
+            method=method,
+            url=url,
+            session=self.session,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
         return result
 
     # Scope module
-    def list_scopes(self, token: Union[str, uuid.UUID], api: str) -> BugoutScopes:
+    def list_scopes(
+        self,
+        token: Union[str, uuid.UUID],
+        api: str,
+        timeout: Optional[TimeoutType] = None,
+    ) -> BugoutScopes:
         scopes_path = f"journals/scopes"
         json = {
             "api": api,
@@ -78,7 +136,11 @@ class Journal:
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.get, path=scopes_path, headers=headers, json=json
+            method=Method.get,
+            path=scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return BugoutScopes(**result)
 
@@ -88,6 +150,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         holder_ids: Optional[List[Union[str, uuid.UUID]]] = None,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalPermissions:
         journal_scopes_path = f"journals/{journal_id}/permissions"
@@ -106,18 +169,25 @@ class Journal:
             path=journal_scopes_path,
             params=query_params,
             headers=headers,
+            timeout=timeout,
         )
         return BugoutJournalPermissions(**result)
 
     def get_journal_scopes(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutJournalScopeSpecs:
         journal_scopes_path = f"journals/{journal_id}/scopes"
         headers = {
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.get, path=journal_scopes_path, headers=headers
+            method=Method.get,
+            path=journal_scopes_path,
+            headers=headers,
+            timeout=timeout,
         )
         return BugoutJournalScopeSpecs(**result)
 
@@ -129,6 +199,7 @@ class Journal:
         holder_id: Union[str, uuid.UUID],
         permission_list: List[str],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalScopeSpecs:
         journal_scopes_path = f"journals/{journal_id}/scopes"
@@ -143,7 +214,11 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.post, path=journal_scopes_path, headers=headers, json=json
+            method=Method.post,
+            path=journal_scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return BugoutJournalScopeSpecs(**result)
 
@@ -155,6 +230,7 @@ class Journal:
         holder_id: Union[str, uuid.UUID],
         permission_list: List[str],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalScopeSpecs:
         journal_scopes_path = f"journals/{journal_id}/scopes"
@@ -169,7 +245,11 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.delete, path=journal_scopes_path, headers=headers, json=json
+            method=Method.delete,
+            path=journal_scopes_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return BugoutJournalScopeSpecs(**result)
 
@@ -180,9 +260,10 @@ class Journal:
         name: str,
         journal_type: JournalTypes,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournal:
-        journal_path = "journals/"
+        journal_path = "journals"
         json = {"name": name, "journal_type": journal_type.value}
         headers = {
             "Authorization": f"{auth_type.value} {token}",
@@ -190,7 +271,11 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.post, path=journal_path, headers=headers, json=json
+            method=Method.post,
+            path=journal_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return BugoutJournal(**result)
 
@@ -198,15 +283,18 @@ class Journal:
         self,
         token: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournals:
-        journal_path = "journals/"
+        journal_path = "journals"
         headers = {
             "Authorization": f"{auth_type.value} {token}",
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=journal_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=journal_path, headers=headers, timeout=timeout
+        )
         return BugoutJournals(**result)
 
     def get_journal(
@@ -214,6 +302,7 @@ class Journal:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournal:
         journal_id_path = f"journals/{journal_id}"
@@ -222,7 +311,9 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=journal_id_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=journal_id_path, headers=headers, timeout=timeout
+        )
         return BugoutJournal(**result)
 
     def update_journal(
@@ -231,6 +322,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         name: str,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournal:
         journal_id_path = f"journals/{journal_id}"
@@ -243,7 +335,11 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.put, path=journal_id_path, headers=headers, json=json
+            method=Method.put,
+            path=journal_id_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return BugoutJournal(**result)
 
@@ -252,6 +348,7 @@ class Journal:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournal:
         journal_id_path = f"journals/{journal_id}"
@@ -260,7 +357,9 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.delete, path=journal_id_path, headers=headers)
+        result = self._call(
+            method=Method.delete, path=journal_id_path, headers=headers, timeout=timeout
+        )
         return BugoutJournal(**result)
 
     # Entry module
@@ -275,6 +374,7 @@ class Journal:
         context_id: Optional[str] = None,
         context_type: Optional[str] = None,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntry:
         entry_path = f"journals/{journal_id}/entries"
@@ -291,10 +391,14 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(
-            method=Method.post, path=entry_path, headers=headers, json=json
+        raw = self._call_raw(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
-        return BugoutJournalEntry(**result)
+        return BugoutJournalEntry.parse_raw(raw)
 
     def create_entries_pack(
         self,
@@ -302,6 +406,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entries: BugoutJournalEntriesRequest,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntries:
         entry_path = f"journals/{journal_id}/bulk"
@@ -323,10 +428,14 @@ class Journal:
                 for entry in entries.entries
             ]
         }
-        result = self._call(
-            method=Method.post, path=entry_path, headers=headers, json=json
+        raw = self._call_raw(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
-        return BugoutJournalEntries(**result)
+        return BugoutJournalEntries.parse_raw(raw)
 
     def get_entry(
         self,
@@ -334,6 +443,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntry:
         entry_id_path = f"journals/{journal_id}/entries/{entry_id}"
@@ -342,14 +452,17 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=entry_id_path, headers=headers)
-        return BugoutJournalEntry(**result)
+        raw = self._call_raw(
+            method=Method.get, path=entry_id_path, headers=headers, timeout=timeout
+        )
+        return BugoutJournalEntry.parse_raw(raw)
 
     def get_entries(
         self,
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntries:
         entry_path = f"journals/{journal_id}/entries"
@@ -358,8 +471,55 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=entry_path, headers=headers)
-        return BugoutJournalEntries(**result)
+        raw = self._call_raw(
+            method=Method.get, path=entry_path, headers=headers, timeout=timeout
+        )
+        return BugoutJournalEntries.parse_raw(raw)
+
+    def iter_entries(
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[BugoutJournalEntry]:
+        """
+        Yield journal entries while response is downloaded, without keeping whole
+        list in memory. Entries are parsed incrementally if optional dependency
+        ijson is installed: pip install "bugout[stream]", otherwise response is
+        parsed at once.
+        """
+        try:
+            import ijson  # type: ignore
+        except ImportError:
+            ijson = None
+
+        entry_path = f"journals/{journal_id}/entries"
+        headers = {
+            "Authorization": f"{auth_type.value} {token}",
+        }
+        if "headers" in kwargs.keys():
+            headers.update(kwargs["headers"])
+
+        if ijson is None:
+            result = self._call(
+                method=Method.get, path=entry_path, headers=headers, timeout=timeout
+            )
+            for entry in result["entries"]:
+                yield BugoutJournalEntry(**entry)
+            return
+
+        response = make_request_stream(
+            method=Method.get,
+            url=f"{self._base_url}/{entry_path}",
+            session=self.session,
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        with response:
+            for entry in ijson.items(response.raw, "entries.item", use_float=True):
+                yield BugoutJournalEntry(**entry)
 
     def get_entry_content(
         self,
@@ -367,6 +527,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntryContent:
         entry_id_content_path = f"journals/{journal_id}/entries/{entry_id}/content"
@@ -376,7 +537,10 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.get, path=entry_id_content_path, headers=headers
+            method=Method.get,
+            path=entry_id_content_path,
+            headers=headers,
+            timeout=timeout,
         )
         return BugoutJournalEntryContent(**result)
 
@@ -393,6 +557,7 @@ class Journal:
         context_id: Optional[str] = None,
         context_type: Optional[str] = None,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntryContent:
         entry_id_content_path = f"journals/{journal_id}/entries/{entry_id}/content"
@@ -418,6 +583,7 @@ class Journal:
             headers=headers,
             json=json,
             params=params,
+            timeout=timeout,
         )
         return BugoutJournalEntryContent(**result)
 
@@ -427,6 +593,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntry:
         entry_id_path = f"journals/{journal_id}/entries/{entry_id}"
@@ -435,18 +602,25 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.delete, path=entry_id_path, headers=headers)
-        return BugoutJournalEntry(**result)
+        raw = self._call_raw(
+            method=Method.delete, path=entry_id_path, headers=headers, timeout=timeout
+        )
+        return BugoutJournalEntry.parse_raw(raw)
 
     # Tags module
     def get_most_used_tags(
-        self, token: Union[str, uuid.UUID], journal_id: Union[str, uuid.UUID]
+        self,
+        token: Union[str, uuid.UUID],
+        journal_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> List[Any]:
         tags_path = f"journals/{journal_id}/tags"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=tags_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=tags_path, headers=headers, timeout=timeout
+        )
         return result
 
     def create_tags(
@@ -456,6 +630,7 @@ class Journal:
         entry_id: Union[str, uuid.UUID],
         tags: List[str],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> List[Any]:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
@@ -466,7 +641,11 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.post, path=tags_path, headers=headers, json=json
+            method=Method.post,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return result
 
@@ -476,6 +655,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entries_tags: BugoutJournalEntriesTagsRequest,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntries:
         tags_path = f"journals/{journal_id}/bulk_entries_tags"
@@ -486,12 +666,14 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.post, path=tags_path, headers=headers, json=json_body
+            method=Method.post,
+            path=tags_path,
+            headers=headers,
+            json=json_body,
+            timeout=timeout,
         )
 
-        return BugoutJournalEntries(
-            entries=[BugoutJournalEntry(**entry) for entry in result]
-        )
+        return BugoutJournalEntries(entries=result)
 
     def get_tags(
         self,
@@ -499,6 +681,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntryTags:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
@@ -507,7 +690,9 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=tags_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=tags_path, headers=headers, timeout=timeout
+        )
         return BugoutJournalEntryTags(**result)
 
     def update_tags(
@@ -517,6 +702,7 @@ class Journal:
         entry_id: Union[str, uuid.UUID],
         tags: List[str],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> List[Any]:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
@@ -527,7 +713,11 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.put, path=tags_path, headers=headers, json=json
+            method=Method.put,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return result
 
@@ -538,6 +728,7 @@ class Journal:
         entry_id: Union[str, uuid.UUID],
         tag: str,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntryTags:
         tags_path = f"journals/{journal_id}/entries/{entry_id}/tags"
@@ -548,7 +739,11 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.delete, path=tags_path, headers=headers, json=json
+            method=Method.delete,
+            path=tags_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
         return BugoutJournalEntryTags(**result)
 
@@ -558,6 +753,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entries_tags: BugoutJournalEntriesTagsRequest,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntries:
         tags_path = f"journals/{journal_id}/bulk_entries_tags"
@@ -568,12 +764,14 @@ class Journal:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.delete, path=tags_path, headers=headers, json=json_body
+            method=Method.delete,
+            path=tags_path,
+            headers=headers,
+            json=json_body,
+            timeout=timeout,
         )
 
-        return BugoutJournalEntries(
-            entries=[BugoutJournalEntry(**entry) for entry in result]
-        )
+        return BugoutJournalEntries(entries=result)
 
     # Entity module
     def create_entity(
@@ -586,6 +784,7 @@ class Journal:
         required_fields: List[Dict[str, Union[str, bool, int, list]]] = [],
         secondary_fields: Dict[str, Any] = {},
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntity:
         path = f"journals/{journal_id}/entities"
@@ -601,7 +800,9 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.post, path=path, headers=headers, json=json)
+        result = self._call(
+            method=Method.post, path=path, headers=headers, json=json, timeout=timeout
+        )
         return BugoutJournalEntity(**result)
 
     def create_entities_pack(
@@ -610,6 +811,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entities: List[BugoutJournalEntityRequest],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntities:
         path = f"journals/{journal_id}/entities/bulk"
@@ -630,7 +832,9 @@ class Journal:
                 for entity in entities
             ]
         }
-        result = self._call(method=Method.post, path=path, headers=headers, json=json)
+        result = self._call(
+            method=Method.post, path=path, headers=headers, json=json, timeout=timeout
+        )
         return BugoutJournalEntities(**result)
 
     def get_entity(
@@ -639,6 +843,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entity_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntity:
         path = f"journals/{journal_id}/entities/{entity_id}"
@@ -647,7 +852,9 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=path, headers=headers)
+        result = self._call(
+            method=Method.get, path=path, headers=headers, timeout=timeout
+        )
         return BugoutJournalEntity(**result)
 
     def get_entities(
@@ -655,6 +862,7 @@ class Journal:
         token: Union[str, uuid.UUID],
         journal_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntities:
         path = f"journals/{journal_id}/entities"
@@ -663,7 +871,9 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=path, headers=headers)
+        result = self._call(
+            method=Method.get, path=path, headers=headers, timeout=timeout
+        )
         return BugoutJournalEntities(**result)
 
     def update_entity(
@@ -677,6 +887,7 @@ class Journal:
         required_fields: List[Dict[str, Union[str, bool, int, list]]] = [],
         secondary_fields: Dict[str, Any] = {},
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntity:
         path = f"journals/{journal_id}/entities/{entity_id}"
@@ -699,6 +910,7 @@ class Journal:
             headers=headers,
             json=json,
             params=params,
+            timeout=timeout,
         )
         return BugoutJournalEntity(**result)
 
@@ -708,6 +920,7 @@ class Journal:
         journal_id: Union[str, uuid.UUID],
         entity_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntity:
         path = f"journals/{journal_id}/entities/{entity_id}"
@@ -716,7 +929,9 @@ class Journal:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.delete, path=path, headers=headers)
+        result = self._call(
+            method=Method.delete, path=path, headers=headers, timeout=timeout
+        )
         return BugoutJournalEntity(**result)
 
     # Search module
@@ -732,6 +947,7 @@ class Journal:
         order: SearchOrder = SearchOrder.DESCENDING,
         representation: EntryRepresentationTypes = EntryRepresentationTypes.ENTRY,
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutSearchResults:
         search_path = f"journals/{journal_id}/search"
@@ -750,26 +966,34 @@ class Journal:
             "representation": representation.value,
         }
         result = self._call(
-            method=Method.get, path=search_path, params=query_params, headers=headers
+            method=Method.get,
+            path=search_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
         )
-        return BugoutSearchResults(**result)
+        return parse_search_results(result, representation)
 
     # Public journals module
     def check_journal_public(
         self,
         journal_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> bool:
         check_path = f"public/{journal_id}/check"
         headers = {}
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=check_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=check_path, headers=headers, timeout=timeout
+        )
         return result
 
     def list_public_journals(
         self,
         user_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournals:
         public_journals_path = "public"
@@ -782,12 +1006,14 @@ class Journal:
             path=public_journals_path,
             params=query_params,
             headers=headers,
+            timeout=timeout,
         )
         return BugoutJournals(**result)
 
     def get_public_journal(
         self,
         journal_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournal:
         public_journal_path = f"public/{journal_id}"
@@ -798,24 +1024,27 @@ class Journal:
             method=Method.get,
             path=public_journal_path,
             headers=headers,
+            timeout=timeout,
         )
         return BugoutJournal(**result)
 
     def get_public_journal_entries(
         self,
         journal_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntries:
         public_journal_path = f"public/{journal_id}/entries"
         headers = {}
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(
+        raw = self._call_raw(
             method=Method.get,
             path=public_journal_path,
             headers=headers,
+            timeout=timeout,
         )
-        return BugoutJournalEntries(**result)
+        return BugoutJournalEntries.parse_raw(raw)
 
     def create_public_journal_entry(
         self,
@@ -826,6 +1055,7 @@ class Journal:
         context_url: Optional[str] = None,
         context_id: Optional[str] = None,
         context_type: Optional[str] = None,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntry:
         entry_path = f"public/{journal_id}/entries"
@@ -840,15 +1070,20 @@ class Journal:
         headers = {}
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(
-            method=Method.post, path=entry_path, headers=headers, json=json
+        raw = self._call_raw(
+            method=Method.post,
+            path=entry_path,
+            headers=headers,
+            json=json,
+            timeout=timeout,
         )
-        return BugoutJournalEntry(**result)
+        return BugoutJournalEntry.parse_raw(raw)
 
     def touch_public_journal_entry(
         self,
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> List[str]:
         public_journal_path = f"public/{journal_id}/entries/{entry_id}"
@@ -859,6 +1094,7 @@ class Journal:
             method=Method.put,
             path=public_journal_path,
             headers=headers,
+            timeout=timeout,
         )
         return result
 
@@ -866,18 +1102,20 @@ class Journal:
         self,
         journal_id: Union[str, uuid.UUID],
         entry_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutJournalEntry:
         public_journal_path = f"public/{journal_id}/entries/{entry_id}"
         headers = {}
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(
+        raw = self._call_raw(
             method=Method.get,
             path=public_journal_path,
             headers=headers,
+            timeout=timeout,
         )
-        return BugoutJournalEntry(**result)
+        return BugoutJournalEntry.parse_raw(raw)
 
     def public_search(
         self,
@@ -888,6 +1126,7 @@ class Journal:
         offset: int = 0,
         content: bool = True,
         order: SearchOrder = SearchOrder.DESCENDING,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutSearchResults:
         search_path = f"public/{journal_id}/search"
@@ -903,6 +1142,10 @@ class Journal:
             "order": order.value,
         }
         result = self._call(
-            method=Method.get, path=search_path, params=query_params, headers=headers
+            method=Method.get,
+            path=search_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
         )
-        return BugoutSearchResults(**result)
+        return parse_search_results(result)
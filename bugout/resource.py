@@ -2,7 +2,7 @@ import json
 import uuid
 from typing import Any, Dict, Optional, Union
 
-from .calls import make_request
+from .calls import SessionType, TimeoutType, make_request
 from .data import (
     BugoutResource,
     BugoutResources,
@@ -20,16 +20,39 @@ class Resource:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
+        session: Optional[SessionType] = None,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid brood url specified")
         self.url = url
+        self._base_url = url.rstrip("/")
         self.timeout = timeout
+        self.session = session
 
-    def _call(self, method: Method, path: str, **kwargs):
-        url = f"{self.url.rstrip('/')}/{path}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+    def _call(
+        self,
+        method: Union[str, Method],
+        path: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[TimeoutType] = None,
+    ):
+        url = f"{self._base_url}/{path}"
+        result = make_request(
+            method=method,
+            url=url,
+            session=self.session,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
         return result
 
     def create_resource(
@@ -37,6 +60,7 @@ class Resource:
         token: Union[str, uuid.UUID],
         application_id: Union[str, uuid.UUID],
         resource_data: Dict[str, Any],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResource:
         resources_path = "resources/"
         headers = {
@@ -47,7 +71,11 @@ class Resource:
             "resource_data": resource_data,
         }
         result = self._call(
-            method=Method.post, path=resources_path, headers=headers, json=json_data
+            method=Method.post,
+            path=resources_path,
+            headers=headers,
+            json=json_data,
+            timeout=timeout,
         )
         return BugoutResource(**result)
 
@@ -55,25 +83,33 @@ class Resource:
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResource:
         resources_path = f"resources/{resource_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=resources_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=resources_path, headers=headers, timeout=timeout
+        )
         return BugoutResource(**result)
 
     def list_resources(
         self,
         token: Union[str, uuid.UUID],
         params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResources:
         resources_path = "resources/"
         headers = {
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.get, path=resources_path, params=params, headers=headers
+            method=Method.get,
+            path=resources_path,
+            params=params,
+            headers=headers,
+            timeout=timeout,
         )
         return BugoutResources(**result)
 
@@ -82,6 +118,7 @@ class Resource:
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
         resource_data_update: Dict[str, Any],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResource:
         resources_path = f"resources/{resource_id}"
         headers = {
@@ -92,6 +129,7 @@ class Resource:
             path=resources_path,
             headers=headers,
             json=resource_data_update,
+            timeout=timeout,
         )
         return BugoutResource(**result)
 
@@ -99,24 +137,30 @@ class Resource:
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResource:
         resources_path = f"resources/{resource_id}"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.delete, path=resources_path, headers=headers)
+        result = self._call(
+            method=Method.delete, path=resources_path, headers=headers, timeout=timeout
+        )
         return BugoutResource(**result)
 
     def get_resource_holders(
         self,
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResourceHolders:
         path = f"resources/{resource_id}/holders"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.get, path=path, headers=headers)
+        result = self._call(
+            method=Method.get, path=path, headers=headers, timeout=timeout
+        )
         return BugoutResourceHolders(**result)
 
     def add_resource_holder_permissions(
@@ -124,6 +168,7 @@ class Resource:
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
         holder_permissions: BugoutResourceHolder,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResourceHolders:
         path = f"resources/{resource_id}/holders"
         headers = {
@@ -134,6 +179,7 @@ class Resource:
             path=path,
             headers=headers,
             json=json.loads(holder_permissions.json(by_alias=True)),
+            timeout=timeout,
         )
         return BugoutResourceHolders(**result)
 
@@ -142,6 +188,7 @@ class Resource:
         token: Union[str, uuid.UUID],
         resource_id: Union[str, uuid.UUID],
         holder_permissions: BugoutResourceHolder,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutResourceHolders:
         path = f"resources/{resource_id}/holders"
         headers = {
@@ -152,5 +199,6 @@ class Resource:
             path=path,
             headers=headers,
             json=json.loads(holder_permissions.json(by_alias=True)),
+            timeout=timeout,
         )
         return BugoutResourceHolders(**result)
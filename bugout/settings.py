@@ -13,7 +13,52 @@ except:
         f"Could not parse BUGOUT_REQUESTS_TIMEOUT environment variable as int: {REQUESTS_TIMEOUT_RAW}"
     )
 
+# Keep-alive connections per host in HTTP session pool
+BUGOUT_POOL_MAXSIZE = 50
+BUGOUT_POOL_MAXSIZE_RAW = os.environ.get("BUGOUT_POOL_MAXSIZE")
+try:
+    if BUGOUT_POOL_MAXSIZE_RAW is not None:
+        BUGOUT_POOL_MAXSIZE = int(BUGOUT_POOL_MAXSIZE_RAW)
+except:
+    raise Exception(
+        f"Could not parse BUGOUT_POOL_MAXSIZE environment variable as int: {BUGOUT_POOL_MAXSIZE_RAW}"
+    )
+
+# Retries of idempotent requests on connection errors and 502, 503, 504 responses
+BUGOUT_RETRIES = 3
+BUGOUT_RETRIES_RAW = os.environ.get("BUGOUT_RETRIES")
+try:
+    if BUGOUT_RETRIES_RAW is not None:
+        BUGOUT_RETRIES = int(BUGOUT_RETRIES_RAW)
+except:
+    raise Exception(
+        f"Could not parse BUGOUT_RETRIES environment variable as int: {BUGOUT_RETRIES_RAW}"
+    )
+
 # Web3 signature
 BUGOUT_APPLICATION_ID_HEADER = os.environ.get(
     "BUGOUT_APPLICATION_ID_HEADER", "x-bugout-application-id"
 )
+
+# Cache for idempotent read calls (pings, scopes, token types, etc), 0 to disable
+BUGOUT_CACHE_TTL_SECONDS = 30
+BUGOUT_CACHE_TTL_SECONDS_RAW = os.environ.get("BUGOUT_CACHE_TTL_SECONDS")
+try:
+    if BUGOUT_CACHE_TTL_SECONDS_RAW is not None:
+        BUGOUT_CACHE_TTL_SECONDS = int(BUGOUT_CACHE_TTL_SECONDS_RAW)
+except:
+    raise Exception(
+        f"Could not parse BUGOUT_CACHE_TTL_SECONDS environment variable as int: {BUGOUT_CACHE_TTL_SECONDS_RAW}"
+    )
+
+# Compress request bodies of at least this size with gzip, 0 to disable.
+# Enable only if API server accepts Content-Encoding: gzip requests.
+BUGOUT_GZIP_MIN_BYTES = 0
+BUGOUT_GZIP_MIN_BYTES_RAW = os.environ.get("BUGOUT_GZIP_MIN_BYTES")
+try:
+    if BUGOUT_GZIP_MIN_BYTES_RAW is not None:
+        BUGOUT_GZIP_MIN_BYTES = int(BUGOUT_GZIP_MIN_BYTES_RAW)
+except:
+    raise Exception(
+        f"Could not parse BUGOUT_GZIP_MIN_BYTES environment variable as int: {BUGOUT_GZIP_MIN_BYTES_RAW}"
+    )
@@ -1,7 +1,7 @@
 import uuid
 from typing import Any, Dict, List, Optional, Union
 
-from .calls import make_request
+from .calls import SessionType, TimeoutType, make_request
 from .data import AuthType, BugoutToken, BugoutUser, BugoutUserTokens, Method, TokenType
 from .exceptions import InvalidUrlSpec, TokenInvalidParameters
 from .settings import REQUESTS_TIMEOUT, BUGOUT_APPLICATION_ID_HEADER
@@ -13,16 +13,39 @@ class User:
     """
 
     def __init__(
-        self, url: Optional[str] = None, timeout: float = REQUESTS_TIMEOUT
+        self,
+        url: Optional[str] = None,
+        timeout: TimeoutType = REQUESTS_TIMEOUT,
+        session: Optional[SessionType] = None,
     ) -> None:
         if url is None:
             raise InvalidUrlSpec("Invalid brood url specified")
         self.url = url
+        self._base_url = url.rstrip("/")
         self.timeout = timeout
+        self.session = session
 
-    def _call(self, method: Method, path: str, **kwargs):
-        url = f"{self.url.rstrip('/')}/{path.rstrip('/')}"
-        result = make_request(method=method, url=url, timeout=self.timeout, **kwargs)
+    def _call(
+        self,
+        method: Union[str, Method],
+        path: str,
+        headers: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        timeout: Optional[TimeoutType] = None,
+    ):
+        url = f"{self._base_url}/{path.rstrip('/')}"
+        result = make_request(
+            method=method,
+            url=url,
+            session=self.session,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
         return result
 
     # User module
@@ -33,6 +56,7 @@ class User:
         password: Optional[str] = None,
         signature: Optional[str] = None,
         application_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         create_user_path = "user"
@@ -47,7 +71,11 @@ class User:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.post, path=create_user_path, headers=headers, data=data
+            method=Method.post,
+            path=create_user_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
         return BugoutUser(**result)
 
@@ -55,6 +83,7 @@ class User:
         self,
         token: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         get_user_path = "user"
@@ -63,7 +92,9 @@ class User:
         }
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
-        result = self._call(method=Method.get, path=get_user_path, headers=headers)
+        result = self._call(
+            method=Method.get, path=get_user_path, headers=headers, timeout=timeout
+        )
         return BugoutUser(**result)
 
     def get_user_by_id(
@@ -71,6 +102,7 @@ class User:
         token: Union[str, uuid.UUID],
         user_id: Union[str, uuid.UUID],
         auth_type: AuthType = AuthType.bearer,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         get_user_by_id_path = f"user/{user_id}"
@@ -80,7 +112,10 @@ class User:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.get, path=get_user_by_id_path, headers=headers
+            method=Method.get,
+            path=get_user_by_id_path,
+            headers=headers,
+            timeout=timeout,
         )
         return BugoutUser(**result)
 
@@ -91,6 +126,7 @@ class User:
         username: Optional[str] = None,
         application_id: Optional[Union[str, uuid.UUID]] = None,
         token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         find_user_path = f"user/find"
@@ -111,12 +147,19 @@ class User:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.get, path=find_user_path, params=query_params, headers=headers
+            method=Method.get,
+            path=find_user_path,
+            params=query_params,
+            headers=headers,
+            timeout=timeout,
         )
         return BugoutUser(**result)
 
     def confirm_email(
-        self, token: Union[str, uuid.UUID], verification_code: str
+        self,
+        token: Union[str, uuid.UUID],
+        verification_code: str,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutUser:
         confirm_user_email_path = "confirm"
         data = {
@@ -126,34 +169,52 @@ class User:
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.post, path=confirm_user_email_path, headers=headers, data=data
+            method=Method.post,
+            path=confirm_user_email_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
         return BugoutUser(**result)
 
     def restore_password(
-        self, email: str, application_id: Optional[Union[str, uuid.UUID]] = None
+        self,
+        email: str,
+        application_id: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> Dict[str, str]:
         restore_password_path = "password/restore"
         data = {
             "email": email,
             "application_id": application_id,
         }
-        result = self._call(method=Method.post, path=restore_password_path, data=data)
+        result = self._call(
+            method=Method.post, path=restore_password_path, data=data, timeout=timeout
+        )
         return result
 
     def reset_password(
-        self, reset_id: Union[str, uuid.UUID], new_password: str
+        self,
+        reset_id: Union[str, uuid.UUID],
+        new_password: str,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutUser:
         reset_password_path = "password/reset"
         data = {
             "reset_id": reset_id,
             "new_password": new_password,
         }
-        result = self._call(method=Method.post, path=reset_password_path, data=data)
+        result = self._call(
+            method=Method.post, path=reset_password_path, data=data, timeout=timeout
+        )
         return BugoutUser(**result)
 
     def change_password(
-        self, token: Union[str, uuid.UUID], current_password: str, new_password: str
+        self,
+        token: Union[str, uuid.UUID],
+        current_password: str,
+        new_password: str,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutUser:
         change_password_path = "password/change"
         data = {
@@ -164,7 +225,11 @@ class User:
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.post, path=change_password_path, headers=headers, data=data
+            method=Method.post,
+            path=change_password_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
         return BugoutUser(**result)
 
@@ -173,6 +238,7 @@ class User:
         token: Union[str, uuid.UUID],
         user_id: Union[str, uuid.UUID],
         password: Optional[str] = None,
+        timeout: Optional[TimeoutType] = None,
         **kwargs: Dict[str, Any],
     ) -> BugoutUser:
         delete_user_path = f"user/{user_id}"
@@ -185,7 +251,11 @@ class User:
         if "headers" in kwargs.keys():
             headers.update(kwargs["headers"])
         result = self._call(
-            method=Method.delete, path=delete_user_path, headers=headers, data=data
+            method=Method.delete,
+            path=delete_user_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
         return BugoutUser(**result)
 
@@ -196,6 +266,7 @@ class User:
         password: str,
         application_id: Optional[Union[str, uuid.UUID]] = None,
         token_note: Optional[str] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutToken:
         create_token_path = "token"
         data = {
@@ -204,21 +275,28 @@ class User:
             "application_id": application_id,
             "token_note": token_note,
         }
-        result = self._call(method=Method.post, path=create_token_path, data=data)
+        result = self._call(
+            method=Method.post, path=create_token_path, data=data, timeout=timeout
+        )
         return BugoutToken(**result)
 
-    def create_token_restricted(self, token: Union[str, uuid.UUID]) -> BugoutToken:
+    def create_token_restricted(
+        self, token: Union[str, uuid.UUID], timeout: Optional[TimeoutType] = None
+    ) -> BugoutToken:
         create_token_path = "token/restricted"
         headers = {
             "Authorization": f"Bearer {token}",
         }
-        result = self._call(method=Method.post, path=create_token_path, headers=headers)
+        result = self._call(
+            method=Method.post, path=create_token_path, headers=headers, timeout=timeout
+        )
         return BugoutToken(**result)
 
     def revoke_token(
         self,
         token: Union[str, uuid.UUID],
         target_token: Optional[Union[str, uuid.UUID]] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> uuid.UUID:
         revoke_token_path = "token"
         headers = {
@@ -228,13 +306,21 @@ class User:
         if target_token is not None:
             data.update({"target_token": target_token})
         result = self._call(
-            method=Method.delete, path=revoke_token_path, headers=headers, data=data
+            method=Method.delete,
+            path=revoke_token_path,
+            headers=headers,
+            data=data,
+            timeout=timeout,
         )
         return result
 
-    def revoke_token_by_id(self, token: Union[str, uuid.UUID]) -> uuid.UUID:
+    def revoke_token_by_id(
+        self, token: Union[str, uuid.UUID], timeout: Optional[TimeoutType] = None
+    ) -> uuid.UUID:
         revoke_token_path = f"token/{token}"
-        result = self._call(method=Method.delete, path=revoke_token_path)
+        result = self._call(
+            method=Method.delete, path=revoke_token_path, timeout=timeout
+        )
         return result
 
     def update_token(
@@ -242,6 +328,7 @@ class User:
         token: Union[str, uuid.UUID],
         token_type: Optional[TokenType] = None,
         token_note: Optional[str] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutToken:
         update_token_path = "token"
 
@@ -255,16 +342,23 @@ class User:
         if token_note is not None:
             data.update({"token_note": token_note})
 
-        result = self._call(method=Method.put, path=update_token_path, data=data)
+        result = self._call(
+            method=Method.put, path=update_token_path, data=data, timeout=timeout
+        )
         return BugoutToken(**result)
 
-    def get_token_types(self, token: Union[str, uuid.UUID]) -> List[str]:
+    def get_token_types(
+        self, token: Union[str, uuid.UUID], timeout: Optional[TimeoutType] = None
+    ) -> List[str]:
         get_token_types_path = "token/types"
         headers = {
             "Authorization": f"Bearer {token}",
         }
         result = self._call(
-            method=Method.get, path=get_token_types_path, headers=headers
+            method=Method.get,
+            path=get_token_types_path,
+            headers=headers,
+            timeout=timeout,
         )
         return result
 
@@ -274,6 +368,7 @@ class User:
         active: Optional[bool] = None,
         token_type: Optional[TokenType] = None,
         restricted: Optional[bool] = None,
+        timeout: Optional[TimeoutType] = None,
     ) -> BugoutUserTokens:
         get_user_tokens_path = "tokens"
         headers = {
@@ -291,5 +386,6 @@ class User:
             path=get_user_tokens_path,
             params=query_params,
             headers=headers,
+            timeout=timeout,
         )
         return BugoutUserTokens(**result)
@@ -43,6 +43,10 @@ setup(
     extras_require={
         "dev": ["black", "mypy", "isort", "types-requests"],
         "distribute": ["setuptools", "twine", "wheel"],
+        "async": ["aiohttp"],
+        "speedups": ["orjson"],
+        "stream": ["ijson"],
+        "httpx": ["httpx[http2]"],
     },
     entry_points={
         "console_scripts": ["{0}-py = {0}.__main__:main".format(MODULE_NAME)]